@@ -15,13 +15,17 @@ from speech_to_text.audio.recorder import AudioRecorder
 from speech_to_text.transcriber.whisper import WhisperTranscriber
 from speech_to_text.utils import setup_logging, handle_transcription
 from speech_to_text.utils.path_utils import (
-    ensure_directory,
     validate_file_path,
     safe_read_file,
 )
 from speech_to_text.utils.api_utils import cleanup_session
 from speech_to_text.chat import ChatHandler
-from speech_to_text.config.settings import MLXW_OUTPUT_FILENAME, OUTPUT_DIR
+from speech_to_text.config.bootstrap import ensure_directories
+from speech_to_text.config.settings import (
+    MLXW_OUTPUT_FILENAME,
+    OUTPUT_DIR,
+    log_configuration,
+)
 
 app = create_app()
 
@@ -44,10 +48,10 @@ def home():
     }
 
 def verify_output_directory() -> None:
-    """Verify and create output directory if it doesn't exist."""
-    if not ensure_directory(OUTPUT_DIR):
+    """Verify and create the output directories once at startup."""
+    # ensure_directories() creates OUTPUT_DIR; only its writability is left to check
+    if not ensure_directories() or not os.access(OUTPUT_DIR, os.W_OK):
         raise RuntimeError(f"Failed to create/verify output directory: {OUTPUT_DIR}")
-    logging.info(f"Output directory verified/created: {OUTPUT_DIR}")
 
 def validate_doc_path(doc_path: str) -> bool:
     """
@@ -72,10 +76,15 @@ def validate_doc_path(doc_path: str) -> bool:
         logging.error(f"Failed to read document or empty file: {doc_path}")
         return False
 
-    lines = content.splitlines()
-    preview_lines = lines[:10]
-    preview = "\n".join(preview_lines)
-    logging.debug(f"Document preview (first 10 lines):\n{preview}\n...")
+    # Slice out the first 10 lines without splitting the whole document
+    preview_end = -1
+    for _ in range(10):
+        preview_end = content.find("\n", preview_end + 1)
+        if preview_end < 0:
+            break
+    preview = content if preview_end < 0 else content[:preview_end]
+    line_count = content.count("\n") + 1
+    logging.debug(f"Document preview (first 10 of {line_count} lines):\n{preview}\n...")
     logging.info(f"Document validated: {doc_path}")
     return True
 
@@ -88,7 +97,6 @@ def run_cli(args):
     """
     logging.info("=== Application Initialization (CLI Mode) ===")
     logging.info(f"Current working directory: {os.getcwd()}")
-    verify_output_directory()
 
     # Validate document path if provided
     if args.doc and not validate_doc_path(args.doc):
@@ -262,9 +270,11 @@ def main():
     )
 
     args = parser.parse_args()
+    log_configuration()
     setup_logging()
 
     try:
+        verify_output_directory()
         if args.server:
             run_server(args.port)
         else:
@@ -9,7 +9,6 @@ import logging
 import uuid
 from pathlib import Path
 from flask import Blueprint, jsonify, request
-from queue import Queue
 from threading import Event, Thread
 
 from speech_to_text.audio.recorder import AudioRecorder
@@ -20,6 +19,7 @@ from speech_to_text.utils.path_utils import validate_file_path
 from speech_to_text.utils.api_utils import (
     create_status_response,
     create_status_callback,
+    create_status_queue,
     session_queues,
     cleanup_session,
 )
@@ -93,7 +93,7 @@ def start_chat():
     stop_event = Event()
 
     # Create status queue for this session
-    status_queue = Queue()
+    status_queue = create_status_queue()
     session_queues[session_id] = status_queue
 
     try:
@@ -8,7 +8,6 @@ and status updates are sent via the SSE endpoint.
 import logging
 import uuid
 from flask import Blueprint, jsonify
-from queue import Queue
 from threading import Event, Thread
 
 from speech_to_text.audio.recorder import AudioRecorder
@@ -17,6 +16,7 @@ from speech_to_text.utils import handle_transcription
 from speech_to_text.utils.api_utils import (
     create_status_response,
     create_status_callback,
+    create_status_queue,
     session_queues,
     cleanup_session,
 )
@@ -35,7 +35,7 @@ def start_recording():
     stop_event = Event()
 
     # Create status queue for this session
-    status_queue = Queue()
+    status_queue = create_status_queue()
     session_queues[session_id] = status_queue
 
     try:
@@ -11,7 +11,12 @@ from threading import Lock
 from typing import Dict, Optional
 
 from speech_to_text.config.settings import SSE_RETRY_TIMEOUT, SSE_KEEPALIVE_TIMEOUT
-from speech_to_text.utils.api_utils import format_sse, session_queues, cleanup_session
+from speech_to_text.utils.api_utils import (
+    TERMINAL_STATUSES,
+    cleanup_session,
+    format_sse,
+    session_queues,
+)
 
 status_bp = Blueprint("connect_status", __name__)
 
@@ -104,7 +109,7 @@ def stream_status(session_id: str):
                     yield format_sse(data=event_data["data"], event=event_data["event"])
 
                     # Handle completion or error
-                    if status in ["complete", "error"]:
+                    if status in TERMINAL_STATUSES:
                         cleanup_session(session_id)
                         break
 
@@ -5,13 +5,20 @@ Coordinates between speech recognition, LLM processing, and text-to-speech compo
 """
 
 import logging
+from threading import Semaphore
 from typing import Optional, Tuple
 
 from speech_to_text.chat.chat_history import ChatHistory
-from speech_to_text.llm.mlxw_to_llm import MLXWToLLM
-from speech_to_text.kokoro.mlxw_to_kokoro import KokoroHandler
+from speech_to_text.config.settings import EXIT_COMMANDS, EXIT_COMMAND_MAX_LENGTH
+from speech_to_text.llm.mlxw_to_llm import MLXWToLLM, get_llm_handler
+from speech_to_text.kokoro.mlxw_to_kokoro import KokoroHandler, get_kokoro_handler
 from speech_to_text.utils.path_utils import safe_read_file, validate_file_path
 
+logger = logging.getLogger(__name__)
+
+# Kokoro runs one synthesis at a time; overlapping requests only contend
+_TTS_SEMAPHORE = Semaphore(1)
+
 
 class ChatHandler:
     """Orchestrates chat interactions between components."""
@@ -19,8 +26,22 @@ class ChatHandler:
     def __init__(self):
         """Initialize chat components."""
         self.chat_history = ChatHistory()
-        self.llm_handler = MLXWToLLM()
-        self.kokoro_handler = KokoroHandler()
+        self._llm_handler: Optional[MLXWToLLM] = None
+        self._kokoro_handler: Optional[KokoroHandler] = None
+
+    @property
+    def llm_handler(self) -> MLXWToLLM:
+        """LLM handler, shared across chats and created on first use."""
+        if self._llm_handler is None:
+            self._llm_handler = get_llm_handler()
+        return self._llm_handler
+
+    @property
+    def kokoro_handler(self) -> KokoroHandler:
+        """Kokoro handler, shared across chats and created on first use."""
+        if self._kokoro_handler is None:
+            self._kokoro_handler = get_kokoro_handler()
+        return self._kokoro_handler
 
     def process_message(
         self,
@@ -49,8 +70,8 @@ class ChatHandler:
         """
         try:
             # Check for exit command
-            if text.strip().lower() in ["exit", "quit", "stop"]:
-                logging.info("Exit command received in chat")
+            if len(text) <= EXIT_COMMAND_MAX_LENGTH and text.strip().lower() in EXIT_COMMANDS:
+                logger.info("Exit command received in chat")
                 return False, None
 
             # Process with LLM
@@ -60,9 +81,10 @@ class ChatHandler:
                     text, self.chat_history.message_history, doc_path=doc_path
                 )
                 if response_text and llm_response:
-                    # Add messages to history
-                    self.chat_history.add_message("user", text)
-                    self.chat_history.add_message("assistant", response_text)
+                    # Add messages to history with a single write
+                    with self.chat_history.batch():
+                        self.chat_history.add_message("user", text)
+                        self.chat_history.add_message("assistant", response_text)
             else:
                 # New chat - initialize history from response
                 response_text, llm_response = self.llm_handler.process_chat(
@@ -72,42 +94,54 @@ class ChatHandler:
                     self.chat_history.initialize_from_llm_response(llm_response, text)
 
             if not response_text:
-                logging.error("Failed to get response from LLM")
+                logger.error("Failed to get response from LLM")
                 return True, None
 
             # Handle text-to-speech if enabled
             if use_kokoro or stream_to_speakers:
                 try:
                     # Log response text for both streaming and conversion
-                    logging.info(f"Processing text-to-speech: {response_text}")
+                    logger.info("Processing text-to-speech: %s", response_text)
 
                     # Stream to speakers if requested
                     output_path = None
                     if stream_to_speakers:
-                        output_path = self.kokoro_handler.stream_text_to_speakers(
-                            response_text,
-                            optimize=optimize_voice,
-                            save_to_file=save_to_file,
-                        )
-                        logging.info("Chat response streamed to speakers")
+                        with _TTS_SEMAPHORE:
+                            output_path = self.kokoro_handler.stream_text_to_speakers(
+                                response_text,
+                                optimize=optimize_voice,
+                                save_to_file=save_to_file,
+                            )
+                        logger.info("Chat response streamed to speakers")
                     elif save_to_file:
                         # Only save to file if streaming is not enabled
-                        output_path = self.kokoro_handler.convert_text_to_speech(
-                            response_text, optimize=optimize_voice
-                        )
+                        with _TTS_SEMAPHORE:
+                            output_path = self.kokoro_handler.convert_text_to_speech(
+                                response_text, optimize=optimize_voice
+                            )
 
                     if output_path and save_to_file:
-                        logging.info(f"Chat response saved to file: {output_path}")
+                        logger.info("Chat response saved to file: %s", output_path)
 
                 except Exception as e:
-                    logging.error(f"Error in Kokoro conversion/streaming: {e}")
+                    logger.error("Error in Kokoro conversion/streaming: %s", e)
 
             return True, response_text
 
         except Exception as e:
-            logging.error(f"Error processing chat message: {e}")
+            logger.error("Error processing chat message: %s", e)
             return True, None
 
+    def prefetch_document(self, doc_path: Optional[str]) -> None:
+        """
+        Begin loading document context ahead of the next message.
+
+        Args:
+            doc_path: Optional path to document for analysis
+        """
+        if doc_path:
+            self.llm_handler.prefetch_document(doc_path)
+
     def start_new_chat(self) -> bool:
         """
         Reset chat state for a new conversation.
@@ -116,12 +150,14 @@ class ChatHandler:
             bool: True if chat was started successfully
         """
         try:
+            # Persist the previous chat before replacing it
+            self.chat_history.flush()
             self.chat_history = ChatHistory()
-            logging.info("Started new chat session")
+            logger.info("Started new chat session")
             return True
 
         except Exception as e:
-            logging.error(f"Error starting new chat: {e}")
+            logger.error("Error starting new chat: %s", e)
             return False
 
     def load_existing_chat(self, chat_id: str) -> bool:
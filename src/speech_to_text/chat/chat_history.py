@@ -4,59 +4,334 @@ Chat history management for the speech-to-text application.
 Handles saving, loading, and updating chat conversations.
 """
 
-import json
+import atexit
 import logging
+import mmap
 import os
+import sys
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 from speech_to_text.config.settings import (
     CHAT_HISTORY_DIR,
+    CHAT_MAX_RESIDENT_MESSAGES,
     CHAT_PREVIEW_MAX_LENGTH,
     CHAT_FILE_EXTENSION,
+    CHAT_LEGACY_FILE_EXTENSION,
 )
+from speech_to_text.config.bootstrap import directories_ready
+from speech_to_text.utils.json_utils import JSONDecodeError, json_dumps, json_loads
 from speech_to_text.utils.path_utils import (
     ensure_directory,
-    validate_file_path,
-    safe_read_file,
-    safe_write_file,
+    normalize_path,
+    clear_list_cache,
     safe_list_files,
 )
 
+logger = logging.getLogger(__name__)
+
+# Shared role strings so parsed messages don't each hold their own copy
+_ROLE_POOL = {role: sys.intern(role) for role in ("system", "user", "assistant")}
+
+# Record type of the header line in JSONL chat history files
+_METADATA_RECORD_TYPE = "session_metadata"
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    """
+    Encode a chat history record as a single JSONL line.
+
+    Args:
+        record: Metadata or message record
+
+    Returns:
+        bytes: Compact UTF-8 JSON followed by a newline
+    """
+    return json_dumps(record) + b"\n"
+
+
+def _iter_lines(file_path: Path) -> Iterator[bytes]:
+    """
+    Iterate over the lines of a file through a read-only memory map.
+
+    Pages are read on demand by the OS, so large histories are never
+    loaded into one contiguous buffer.
+
+    Args:
+        file_path: File to read
+
+    Yields:
+        bytes: Each line, including its trailing newline
+    """
+    with open(file_path, "rb") as f:
+        # Empty files cannot be mapped
+        if not os.fstat(f.fileno()).st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+
+def _read_last_line(file_path: Path) -> bytes:
+    """
+    Read the last non-empty line of a file by scanning back from its end.
+
+    Args:
+        file_path: File to read
+
+    Returns:
+        bytes: The last line without surrounding whitespace, or b"" if empty
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size
+            while end and mm[end - 1] in b" \t\r\n":
+                end -= 1
+            start = mm.rfind(b"\n", 0, end) + 1
+            return mm[start:end].strip()
+
+
+def _decode_record(line: bytes, file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Decode one JSONL line, tolerating blank and partially written lines.
+
+    Args:
+        line: Raw line from a chat history file
+        file_path: File the line came from, for logging
+
+    Returns:
+        Optional[Dict[str, Any]]: Decoded record or None if the line is unusable
+    """
+    if not line.strip():
+        return None
+    try:
+        return json_loads(line)
+    except JSONDecodeError:
+        # A partial line left by an interrupted append
+        logger.warning("Skipping malformed line in: %s", file_path)
+        return None
+
+
+def _read_messages(file_path: Path, limit: int = 0) -> List[Dict[str, str]]:
+    """
+    Read messages from a JSONL chat history file.
+
+    With a limit, only the leading system messages and the most recent
+    messages are decoded: the rest of the file is skipped by scanning back
+    from its end for line breaks.
+
+    Args:
+        file_path: JSONL chat history file
+        limit: Maximum number of messages to return (0 for all)
+
+    Returns:
+        List[Dict[str, str]]: Messages in file order
+    """
+    if not limit:
+        messages = []
+        for line in _iter_lines(file_path):
+            record = _decode_record(line, file_path)
+            if record and record.get("type") != _METADATA_RECORD_TYPE:
+                messages.append(record)
+        return messages
+
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Metadata header and system messages at the start of the file
+            system_messages = []
+            offset = 0
+            while offset < size:
+                line_end = mm.find(b"\n", offset)
+                if line_end < 0:
+                    line_end = size
+                record = _decode_record(mm[offset:line_end], file_path)
+                if record and record.get("type") != _METADATA_RECORD_TYPE:
+                    if record.get("role") != "system":
+                        break
+                    system_messages.append(record)
+                offset = line_end + 1
+
+            # Most recent messages, walking back from the end of the file
+            recent = []
+            end = size
+            while end > offset and len(system_messages) + len(recent) < limit:
+                start = max(mm.rfind(b"\n", offset, end - 1) + 1, offset)
+                record = _decode_record(mm[start:end], file_path)
+                if record and record.get("type") != _METADATA_RECORD_TYPE:
+                    recent.append(record)
+                end = start
+
+    recent.reverse()
+    # A cut history starts on a user message so exchanges are not split
+    if end > offset:
+        start = 0
+        while start < len(recent) and recent[start].get("role") != "user":
+            start += 1
+        del recent[:start]
+    return system_messages + recent
+
+
+def _flush_all() -> None:
+    """Flush unsaved messages of every live chat history at interpreter exit."""
+    for history in list(ChatHistory._instances):
+        history.flush()
+
+
+def _normalize_messages(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Intern parsed role strings and keep system messages ahead of the conversation.
+
+    The LLM handler sends the history as-is, so the ordering is enforced
+    once here when a chat is loaded rather than on every turn.
+
+    Args:
+        messages: Parsed chat messages
+
+    Returns:
+        List[Dict[str, str]]: The same messages list
+    """
+    misplaced = False
+    in_conversation = False
+    for msg in messages:
+        role = msg.get("role")
+        role = msg["role"] = _ROLE_POOL.get(role, role)
+        if role != "system":
+            in_conversation = True
+        elif in_conversation:
+            misplaced = True
+
+    if misplaced:
+        messages[:] = [msg for msg in messages if msg["role"] == "system"] + [
+            msg for msg in messages if msg["role"] != "system"
+        ]
+    return messages
+
 
 class ChatHistory:
     """Manages chat history storage and retrieval."""
 
+    # Parsed messages of recently used chats, keyed by chat ID and
+    # validated against the file's modification time
+    _history_cache: "OrderedDict[str, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+    _history_cache_size = 16
+    _history_cache_lock = Lock()
+
+    # Live instances, flushed together at interpreter exit
+    _instances: "weakref.WeakSet[ChatHistory]" = weakref.WeakSet()
+
     def __init__(self):
         """Initialize the chat history manager."""
         self._ensure_history_directory()
+        # Resolved once; history file paths are joined onto it directly
+        self._history_dir = normalize_path(CHAT_HISTORY_DIR)
         self.current_chat_id: Optional[str] = None
         self.messages: List[Dict[str, str]] = []
+        self._batch_depth = 0
+        self._batch_pending = False
+        # Messages added since the last write, appended on flush()
+        self._dirty = False
+        self._unflushed: List[Dict[str, str]] = []
+        # Whether the history file holds every message; once true, messages
+        # trimmed from memory exist only on disk and saves append instead
+        self._history_on_disk = False
+        # History file path for the chat ID it was resolved for
+        self._resolved_chat_id: Optional[str] = None
+        self._resolved_path: Optional[Path] = None
+        ChatHistory._instances.add(self)
 
     def _ensure_history_directory(self) -> None:
         """Ensure the chat history directory exists."""
+        if directories_ready():
+            return
         if not ensure_directory(CHAT_HISTORY_DIR):
             raise RuntimeError(
                 f"Failed to create/verify chat history directory: {CHAT_HISTORY_DIR}"
             )
-        logging.debug(f"Chat history directory verified: {CHAT_HISTORY_DIR}")
+        logger.debug("Chat history directory verified: %s", CHAT_HISTORY_DIR)
 
     def _get_history_file_path(self, chat_id: str) -> Optional[Path]:
         """
-        Get the validated file path for a chat history file.
+        Get the file path for a chat history file.
+
+        The path is built once per chat ID and reused on later saves. The
+        history directory was verified at init, so it is not checked again.
 
         Args:
             chat_id: The chat ID to get the path for
 
         Returns:
-            Optional[Path]: Validated Path object or None if validation fails
+            Optional[Path]: Path object for the chat history file
+        """
+        if chat_id != self._resolved_chat_id or not self._resolved_path:
+            self._resolved_chat_id = chat_id
+            self._resolved_path = self._history_dir / f"{chat_id}{CHAT_FILE_EXTENSION}"
+        return self._resolved_path
+
+    def _get_legacy_file_path(self, chat_id: str) -> Optional[Path]:
         """
-        file_path = Path(CHAT_HISTORY_DIR) / f"{chat_id}{CHAT_FILE_EXTENSION}"
-        return validate_file_path(file_path)
+        Get the file path for a legacy whole-document chat history file.
+
+        Args:
+            chat_id: The chat ID to get the path for
+
+        Returns:
+            Optional[Path]: Path object for the legacy chat history file
+        """
+        return self._history_dir / f"{chat_id}{CHAT_LEGACY_FILE_EXTENSION}"
+
+    @classmethod
+    def _get_cached_messages(
+        cls, chat_id: str, mtime: float
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Get cached messages for a chat if the file has not changed since caching.
+
+        Args:
+            chat_id: The chat ID to look up
+            mtime: Current modification time of the chat file
+
+        Returns:
+            Optional[List[Dict[str, str]]]: Copy of the cached messages or None
+        """
+        with cls._history_cache_lock:
+            entry = cls._history_cache.get(chat_id)
+            if entry is None or entry[0] != mtime:
+                return None
+            cls._history_cache.move_to_end(chat_id)
+            return list(entry[1])
+
+    @classmethod
+    def _cache_messages(
+        cls, chat_id: str, mtime: float, messages: List[Dict[str, str]]
+    ) -> None:
+        """
+        Store parsed messages for a chat, evicting the least recently used entry.
+
+        Args:
+            chat_id: The chat ID to cache
+            mtime: Modification time of the chat file
+            messages: Messages to cache
+        """
+        with cls._history_cache_lock:
+            cls._history_cache[chat_id] = (mtime, list(messages))
+            cls._history_cache.move_to_end(chat_id)
+            while len(cls._history_cache) > cls._history_cache_size:
+                cls._history_cache.popitem(last=False)
 
     def _extract_preview(self, messages: List[Dict[str, str]]) -> str:
         """
         Extract preview text from the last chat message.
+
+        The preview is a plain slice; clients render any ellipsis.
         
         Args:
             messages: List of chat messages
@@ -67,14 +342,32 @@ class ChatHistory:
         if not messages:
             return ""
         
-        # Get the last message's content
-        last_message = messages[-1]
-        content = last_message.get("content", "")
-        
-        # Truncate and add ellipsis if needed
-        return content[:CHAT_PREVIEW_MAX_LENGTH] + (
-            "..." if len(content) > CHAT_PREVIEW_MAX_LENGTH else ""
-        )
+        # Get the last message's content, truncated to the preview length
+        return messages[-1].get("content", "")[:CHAT_PREVIEW_MAX_LENGTH]
+
+    def _read_preview(self, file: Path) -> str:
+        """
+        Read preview text from a chat history file.
+
+        Args:
+            file: JSONL or legacy JSON chat history file
+
+        Returns:
+            str: Preview text or empty string if no messages found
+        """
+        if file.suffix == CHAT_LEGACY_FILE_EXTENSION:
+            with open(file, "rb") as f:
+                data = json_loads(f.read())
+            return self._extract_preview(data.get("messages", []))
+
+        # Only the last message line is needed
+        last_line = _read_last_line(file)
+        if not last_line:
+            return ""
+        record = json_loads(last_line)
+        if record.get("type") == _METADATA_RECORD_TYPE:
+            return ""
+        return self._extract_preview([record])
 
     def get_chat_list(self) -> List[Dict[str, Any]]:
         """
@@ -87,8 +380,10 @@ class ChatHistory:
                 - preview: Preview of first user message
         """
         try:
-            # Get all JSON files from chat history directory
-            files = safe_list_files(CHAT_HISTORY_DIR)
+            # Get all chat history files, including legacy JSON files
+            files = safe_list_files(
+                CHAT_HISTORY_DIR, CHAT_FILE_EXTENSION
+            ) + safe_list_files(CHAT_HISTORY_DIR, CHAT_LEGACY_FILE_EXTENSION)
             
             chat_files = []
             for file in files:
@@ -98,15 +393,11 @@ class ChatHistory:
                     chat_id = file.stem
                     
                     # Read chat content for preview
-                    content = safe_read_file(file)
                     preview = ""
-                    if content:
-                        try:
-                            data = json.loads(content)
-                            messages = data.get("messages", [])
-                            preview = self._extract_preview(messages)
-                        except json.JSONDecodeError:
-                            logging.warning(f"Could not parse chat history file: {file}")
+                    try:
+                        preview = self._read_preview(file)
+                    except JSONDecodeError:
+                        logger.warning("Could not parse chat history file: %s", file)
                     
                     chat_files.append({
                         "id": chat_id,
@@ -114,52 +405,184 @@ class ChatHistory:
                         "preview": preview
                     })
                 except Exception as e:
-                    logging.warning(f"Error processing chat file {file}: {e}")
+                    logger.warning("Error processing chat file %s: %s", file, e)
                     continue
 
             # Sort by modification time (newest first)
             return sorted(chat_files, key=lambda x: x["modified"], reverse=True)
             
         except Exception as e:
-            logging.error(f"Error getting chat list: {e}")
+            logger.error("Error getting chat list: %s", e)
             return []
 
     def load_history(self, chat_id: str) -> bool:
         """
         Load chat history from file.
 
+        Only the system messages and the most recent messages, up to
+        CHAT_MAX_RESIDENT_MESSAGES, are kept in memory.
+
         Args:
             chat_id: ID of the chat history to load
 
         Returns:
             bool: True if history was loaded successfully, False otherwise
         """
+        return self.load_history_tail(chat_id, CHAT_MAX_RESIDENT_MESSAGES)
+
+    def load_history_tail(
+        self, chat_id: str, n: int = CHAT_MAX_RESIDENT_MESSAGES
+    ) -> bool:
+        """
+        Load the system messages and the most recent messages of a chat.
+
+        Args:
+            chat_id: ID of the chat history to load
+            n: Maximum number of messages to keep in memory (0 for all)
+
+        Returns:
+            bool: True if history was loaded successfully, False otherwise
+        """
+        # Persist pending messages of the chat being switched away from
+        self.flush()
+
         try:
             file_path = self._get_history_file_path(chat_id)
-            if not file_path or not file_path.exists():
-                logging.error(f"Chat history file not found: {chat_id}")
-                return False
-
-            content = safe_read_file(file_path)
-            if not content:
+            if not file_path:
+                logger.error("Chat history file not found: %s", chat_id)
                 return False
+            # A single stat both detects a missing file and dates the cache
+            try:
+                mtime = file_path.stat().st_mtime
+            except FileNotFoundError:
+                return self._load_legacy_history(chat_id, n)
+
+            # The cache holds histories bounded by the configured limit
+            use_cache = n == CHAT_MAX_RESIDENT_MESSAGES
+            messages = self._get_cached_messages(chat_id, mtime) if use_cache else None
+            if messages is not None:
+                self.messages = messages
+                self.current_chat_id = chat_id
+                self._history_on_disk = True
+                logger.info("Loaded cached chat history for ID: %s", chat_id)
+                return True
 
-            history = json.loads(content)
-            self.messages = history.get("messages", [])
+            self.messages = _normalize_messages(_read_messages(file_path, n))
             self.current_chat_id = chat_id
-            logging.info(f"Loaded chat history for ID: {chat_id}")
+            self._history_on_disk = True
+            if use_cache:
+                self._cache_messages(chat_id, mtime, self.messages)
+            logger.info("Loaded chat history for ID: %s", chat_id)
             return True
 
-        except json.JSONDecodeError as e:
-            logging.error(f"Error parsing chat history JSON: {e}")
+        except JSONDecodeError as e:
+            logger.error("Error parsing chat history JSON: %s", e)
             return False
         except Exception as e:
-            logging.error(f"Error loading chat history: {e}")
+            logger.error("Error loading chat history: %s", e)
+            return False
+
+    def _load_legacy_history(
+        self, chat_id: str, n: int = CHAT_MAX_RESIDENT_MESSAGES
+    ) -> bool:
+        """
+        Load a legacy whole-document chat history and convert it to JSONL.
+
+        Args:
+            chat_id: ID of the chat history to load
+            n: Maximum number of messages to keep in memory (0 for all)
+
+        Returns:
+            bool: True if history was loaded successfully, False otherwise
+        """
+        legacy_path = self._get_legacy_file_path(chat_id)
+
+        # Parse the raw bytes so the contents are not first decoded
+        # (and stripped) as a separate string
+        try:
+            with open(legacy_path, "rb") as f:
+                history = json_loads(f.read())
+        except FileNotFoundError:
+            logger.error("Chat history file not found: %s", chat_id)
+            return False
+        self.messages = _normalize_messages(history.get("messages", []))
+        self.current_chat_id = chat_id
+        self._history_on_disk = False
+
+        # Rewrite the full history as JSONL before trimming so later
+        # messages can be appended; if that fails the full history stays
+        # resident so a later save can still write all of it
+        if self.save_history():
+            logger.info("Converted legacy chat history to JSONL: %s", chat_id)
+            self._trim_messages(n)
+        logger.info("Loaded chat history for ID: %s", chat_id)
+        return True
+
+    def _trim_messages(self, limit: int = CHAT_MAX_RESIDENT_MESSAGES) -> None:
+        """
+        Drop the oldest conversation messages beyond the resident limit.
+
+        Leading system messages are always kept, and the kept conversation
+        starts on a user message so exchanges are not split. Trimmed
+        messages remain in the history file.
+
+        Args:
+            limit: Maximum number of messages to keep (0 for all)
+        """
+        excess = len(self.messages) - limit
+        if not limit or excess <= 0:
+            return
+
+        system_count = 0
+        for msg in self.messages:
+            if msg.get("role") != "system":
+                break
+            system_count += 1
+        end = system_count + excess
+        while end < len(self.messages) and self.messages[end].get("role") != "user":
+            end += 1
+        del self.messages[system_count:end]
+
+    def flush(self) -> bool:
+        """
+        Append messages added since the last write to the chat history file.
+
+        Returns:
+            bool: True if there was nothing to write or the write succeeded
+        """
+        if not self._dirty or not self.current_chat_id:
+            return True
+
+        if not self._history_on_disk:
+            # No complete file to append to yet; write the whole history
+            return self.save_history()
+
+        try:
+            file_path = self._get_history_file_path(self.current_chat_id)
+            if not file_path:
+                return False
+
+            # Only the new lines are written; earlier messages are untouched
+            with open(file_path, "ab") as f:
+                f.writelines(_encode_record(msg) for msg in self._unflushed)
+
+            logger.debug(
+                "Appended %s message(s) to: %s", len(self._unflushed), file_path
+            )
+            self._unflushed.clear()
+            self._dirty = False
+            self._cache_messages(
+                self.current_chat_id, file_path.stat().st_mtime, self.messages
+            )
+            return True
+
+        except Exception as e:
+            logger.error("Error appending to chat history: %s", e)
             return False
 
     def save_history(self) -> bool:
         """
-        Save current chat history to file.
+        Save current chat history to file, rewriting it completely.
 
         Returns:
             bool: True if history was saved successfully, False otherwise
@@ -167,23 +590,71 @@ class ChatHistory:
         if not self.current_chat_id:
             return False
 
+        if self._batch_depth:
+            # Defer the write until the enclosing batch() exits
+            self._batch_pending = True
+            return True
+
+        if self._history_on_disk:
+            # Older messages may only exist on disk; append rather than rewrite
+            return self.flush()
+
         try:
             file_path = self._get_history_file_path(self.current_chat_id)
             if not file_path:
                 return False
 
-            history = {"chat_id": self.current_chat_id, "messages": self.messages}
-
-            content = json.dumps(history, indent=2)
-            if safe_write_file(content, file_path):
-                logging.info(f"Saved chat history to: {file_path}")
-                return True
-            return False
+            metadata = {"type": _METADATA_RECORD_TYPE, "chat_id": self.current_chat_id}
+            content = _encode_record(metadata) + b"".join(
+                _encode_record(msg) for msg in self.messages
+            )
+            # Encoded bytes go straight to disk without a str round trip
+            with open(file_path, "wb") as f:
+                f.write(content)
+            # A legacy file left by an earlier failed conversion is now superseded
+            legacy_path = self._get_legacy_file_path(self.current_chat_id)
+            if legacy_path:
+                legacy_path.unlink(missing_ok=True)
+            clear_list_cache()
+
+            # The rewrite includes any messages not yet flushed
+            self._unflushed.clear()
+            self._dirty = False
+            self._history_on_disk = True
+            self._cache_messages(
+                self.current_chat_id, file_path.stat().st_mtime, self.messages
+            )
+            logger.info("Saved chat history to: %s", file_path)
+            return True
 
         except Exception as e:
-            logging.error(f"Error saving chat history: {e}")
+            logger.error("Error saving chat history: %s", e)
             return False
 
+    @contextmanager
+    def batch(self) -> Iterator["ChatHistory"]:
+        """
+        Group several history updates into a single file write.
+
+        Saves inside the block are deferred, and the history is written
+        (or its new messages flushed) once when the outermost block exits.
+
+        Returns:
+            Iterator[ChatHistory]: This chat history instance
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                if self._batch_pending:
+                    # A full rewrite already includes any added messages
+                    self._batch_pending = False
+                    self.save_history()
+                else:
+                    self.flush()
+
     def initialize_from_llm_response(
         self, llm_response: Dict[str, Any], user_message: str
     ) -> None:
@@ -198,13 +669,15 @@ class ChatHistory:
             # Extract chat ID from response
             chat_id = llm_response.get("id")
             if not chat_id:
-                logging.error("No chat ID found in LLM response")
+                logger.error("No chat ID found in LLM response")
                 return
 
-            # Preserve any existing system messages
-            system_messages = [
-                msg for msg in self.messages if msg.get("role") == "system"
-            ]
+            # Preserve any existing system messages (always at the start)
+            system_messages = []
+            for msg in self.messages:
+                if msg.get("role") != "system":
+                    break
+                system_messages.append(msg)
 
             # Initialize new message array with system messages first
             new_messages = []
@@ -212,7 +685,7 @@ class ChatHistory:
             # Add system messages if they exist
             if system_messages:
                 new_messages.extend(system_messages)
-                logging.debug(f"Preserved {len(system_messages)} system message(s)")
+                logger.debug("Preserved %s system message(s)", len(system_messages))
 
             # Add the initial user/assistant exchange
             new_messages.extend(
@@ -225,21 +698,25 @@ class ChatHistory:
                 ]
             )
 
-            # Update chat state
+            # Update chat state; the new chat's file is written in full below
             self.current_chat_id = chat_id
             self.messages = new_messages
+            self._history_on_disk = False
 
             # Save initial history
             self.save_history()
-            logging.info(f"Initialized new chat history with ID: {chat_id}")
+            logger.info("Initialized new chat history with ID: %s", chat_id)
 
         except Exception as e:
-            logging.error(f"Error initializing chat history: {e}")
+            logger.error("Error initializing chat history: %s", e)
 
     def add_message(self, role: str, content: str) -> None:
         """
         Add a new message to the chat history.
 
+        The message is written on the next flush(), at the end of an
+        enclosing batch(), or at interpreter exit.
+
         Args:
             role: Role of the message sender ("user" or "assistant")
             content: Content of the message
@@ -247,9 +724,14 @@ class ChatHistory:
         if not self.current_chat_id:
             return
 
-        self.messages.append({"role": role, "content": content})
-        self.save_history()
-        logging.debug(f"Added {role} message to chat history")
+        message = {"role": _ROLE_POOL.get(role, role), "content": content}
+        self.messages.append(message)
+        self._unflushed.append(message)
+        self._dirty = True
+        # Messages are only dropped from memory once the file holds them all
+        if self._history_on_disk:
+            self._trim_messages()
+        logger.debug("Added %s message to chat history", role)
 
     @property
     def message_history(self) -> List[Dict[str, str]]:
@@ -259,4 +741,7 @@ class ChatHistory:
         Returns:
             List[Dict[str, str]]: List of message dictionaries
         """
-        return self.messages
\ No newline at end of file
+        return self.messages
+
+
+atexit.register(_flush_all)
@@ -0,0 +1,55 @@
+# File: src/speech_to_text/config/bootstrap.py
+"""
+Process startup tasks for the speech-to-text application.
+Creates the output directories once so handlers can skip the check on init.
+"""
+
+import logging
+import os
+from typing import Tuple
+
+from .settings import CHAT_HISTORY_DIR, KOKORO_CACHE_DIR, KOKORO_CACHE_MAX_BYTES, OUTPUT_DIR
+
+_DIRS_READY = False
+
+
+def _required_directories() -> Tuple[str, ...]:
+    """Get the directories the application writes to."""
+    if KOKORO_CACHE_MAX_BYTES:
+        return (OUTPUT_DIR, CHAT_HISTORY_DIR, KOKORO_CACHE_DIR)
+    return (OUTPUT_DIR, CHAT_HISTORY_DIR)
+
+
+def ensure_directories() -> bool:
+    """
+    Create the output, chat history and TTS cache directories.
+
+    Called once from the entry point; later calls return immediately.
+
+    Returns:
+        bool: True if all directories exist
+    """
+    global _DIRS_READY
+    if _DIRS_READY:
+        return True
+
+    try:
+        for directory in _required_directories():
+            os.makedirs(directory, exist_ok=True)
+    except Exception as e:
+        logging.error(f"Error creating application directories: {e}")
+        return False
+
+    _DIRS_READY = True
+    logging.info(f"Output directories verified/created under: {OUTPUT_DIR}")
+    return True
+
+
+def directories_ready() -> bool:
+    """
+    Check whether ensure_directories() has already succeeded.
+
+    Returns:
+        bool: True if the application directories were created at startup
+    """
+    return _DIRS_READY
@@ -4,19 +4,27 @@ Configuration settings for the speech-to-text application.
 Environment variables take precedence over default values.
 """
 
+import functools
 import os
-import logging
 from pathlib import Path
+from typing import List
 from dotenv import load_dotenv
-import pyaudio
 
 # Load environment variables from .env file in project root
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
-print(f"\n=== Configuration Initialization ===")
-print(f"Looking for .env at: {env_path}")
-print(f".env file exists: {env_path.exists()}\n")
 
-load_dotenv(env_path, override=True)
+# Warnings raised while reading settings, before logging is configured.
+# setup_logging() emits and clears them.
+DEFERRED_WARNINGS: List[str] = []
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load the project .env file once per process."""
+    return load_dotenv(env_path, override=True)
+
+
+_load_env()
 
 
 def get_env_bool(key: str, default: bool) -> bool:
@@ -48,7 +56,7 @@ LOG_FORMAT = os.getenv("LOG_FORMAT", "%(asctime)s - %(levelname)s - %(message)s"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")  # INFO | DEBUG
 
 # Audio Recording Settings
-AUDIO_FORMAT = pyaudio.paInt16
+AUDIO_FORMAT = 8  # pyaudio.paInt16, without loading PortAudio at import time
 CHANNELS = 1
 SAMPLE_RATE = 16000
 CHUNK_SIZE = 1024
@@ -63,7 +71,7 @@ CALIBRATION_BUFFER = 200
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "src/.cache")
 if not OUTPUT_DIR:
     OUTPUT_DIR = "src/.cache"
-    logging.warning(f"OUTPUT_DIR was empty, using default: {OUTPUT_DIR}")
+    DEFERRED_WARNINGS.append(f"OUTPUT_DIR was empty, using default: {OUTPUT_DIR}")
 
 # Whisper Model Settings
 MODEL_NAME = os.getenv("MODEL_NAME", "mlx-community/whisper-tiny-mlx-q4")
@@ -73,7 +81,17 @@ WORD_TIMESTAMPS = False
 # Transcription Validation Settings
 MINIMUM_WORD_COUNT = get_env_int("MINIMUM_WORD_COUNT", 3)
 # Prevent LLM processing due to poor audio or short word count
-SUSPICIOUS_RESPONSES = ["thank you.", "thank you", "thanks", "okay", "ok", "yes", "no"]
+SUSPICIOUS_RESPONSES = frozenset(
+    {"thank you.", "thank you", "thanks", "okay", "ok", "yes", "no"}
+)
+# Stripped and lowercased like transcriptions so checks are a single lookup
+SUSPICIOUS_RESPONSES_NORMALIZED = frozenset(
+    response.strip().lower() for response in SUSPICIOUS_RESPONSES
+)
+# Spoken or typed commands that end a session, stripped and lowercased
+EXIT_COMMANDS = frozenset({"exit", "quit", "stop"})
+# Longer texts (allowing for surrounding whitespace) skip normalization
+EXIT_COMMAND_MAX_LENGTH = 16
 
 # Text Output Settings
 MLXW_OUTPUT_FILENAME = f"{OUTPUT_DIR}/transcription.txt"
@@ -84,8 +102,22 @@ KOKORO_API_KEY = os.getenv("KOKORO_API_KEY", "not-needed")
 KOKORO_MODEL = os.getenv("KOKORO_MODEL", "kokoro")
 KOKORO_VOICE = os.getenv("KOKORO_VOICE", "af_bella")
 KOKORO_SPEED = get_env_float("KOKORO_SPEED", 1.0)
-KOKORO_RESPONSE_FORMAT = "mp3"
-KOKORO_OUTPUT_FILENAME = f"{OUTPUT_DIR}/mlxw_to_kokoro_output.mp3"
+# wav is requested as raw PCM and wrapped locally, skipping server-side encoding
+KOKORO_RESPONSE_FORMAT = os.getenv("KOKORO_RESPONSE_FORMAT", "wav").lower()
+if KOKORO_RESPONSE_FORMAT not in ("wav", "mp3", "opus", "aac", "flac"):
+    DEFERRED_WARNINGS.append(
+        f"Unsupported KOKORO_RESPONSE_FORMAT '{KOKORO_RESPONSE_FORMAT}', using default: wav"
+    )
+    KOKORO_RESPONSE_FORMAT = "wav"
+KOKORO_OUTPUT_FILENAME = f"{OUTPUT_DIR}/mlxw_to_kokoro_output.{KOKORO_RESPONSE_FORMAT}"
+KOKORO_CACHE_DIR = f"{OUTPUT_DIR}/tts_cache"  # Synthesized audio keyed by voice settings and text
+KOKORO_CACHE_MAX_BYTES = get_env_int("KOKORO_CACHE_MAX_BYTES", 256 * 1024 * 1024)  # 0 disables the cache
+# Sentences synthesized concurrently ahead of playback when streaming to speakers
+KOKORO_PREFETCH_SENTENCES = max(1, get_env_int("KOKORO_PREFETCH_SENTENCES", 2))
+# Speaker output period in frames (480 = 20ms at 24kHz); raise on slow hardware
+KOKORO_PYAUDIO_FRAMES_PER_BUFFER = max(
+    64, get_env_int("KOKORO_PYAUDIO_FRAMES_PER_BUFFER", 480)
+)
 
 # LLM Integration Settings
 LLM_BASE_URL = os.getenv("LLM_BASE_URL", "http://127.0.0.1:1234/v1")
@@ -94,30 +126,51 @@ LLM_MODEL = os.getenv(
     "LLM_MODEL", "mistral-small-24b-instruct-2501@4bit"
 )  # Updated default
 LLM_MAX_TOKENS = get_env_int("LLM_MAX_TOKENS", 2048)
+LLM_MAX_HISTORY_TOKENS = get_env_int("LLM_MAX_HISTORY_TOKENS", 0)  # Approximate token budget for chat history per request (0 = unlimited)
 LLM_TEMPERATURE = get_env_float("LLM_TEMPERATURE", 0.7)
+# Chat requests kept in flight at once by batch and background calls
+LLM_MAX_CONCURRENCY = max(1, get_env_int("LLM_MAX_CONCURRENCY", 4))
 LLM_OUTPUT_FILENAME = f"{OUTPUT_DIR}/llm_response.txt"
+# Mark system prompt and document context for prompt-prefix caching; also
+# enabled automatically when /models advertises prompt_caching for the model
+LLM_PROMPT_CACHE_CONTROL = get_env_bool("LLM_PROMPT_CACHE_CONTROL", False)
+# Reuse responses to identical requests; only applies at temperature 0
+LLM_RESPONSE_CACHE = get_env_bool("LLM_RESPONSE_CACHE", False)
+# Reuse responses to similar single-turn prompts (requires the semantic extra)
+LLM_SEMANTIC_CACHE = get_env_bool("LLM_SEMANTIC_CACHE", False)
+LLM_SEMANTIC_CACHE_THRESHOLD = get_env_float("LLM_SEMANTIC_CACHE_THRESHOLD", 0.9)  # Minimum cosine similarity
+LLM_SEMANTIC_CACHE_MODEL = os.getenv("LLM_SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+LLM_SEMANTIC_CACHE_DIR = f"{OUTPUT_DIR}/llm_cache"
 
 # Chat History Settings
 CHAT_HISTORY_DIR = f"{OUTPUT_DIR}/chat_history"
 CHAT_PREVIEW_MAX_LENGTH = get_env_int("CHAT_PREVIEW_MAX_LENGTH", 500)  # Maximum length for chat previews
-CHAT_FILE_EXTENSION = ".json"  # Standard extension for chat history files
+CHAT_MAX_RESIDENT_MESSAGES = get_env_int("CHAT_MAX_RESIDENT_MESSAGES", 128)  # Messages kept in memory and sent to the LLM (0 = all)
+CHAT_FILE_EXTENSION = ".jsonl"  # Append-only chat history files (one record per line)
+CHAT_LEGACY_FILE_EXTENSION = ".json"  # Whole-document chat history files, read for compatibility
 
 # API Settings
 SSE_RETRY_TIMEOUT = 3000    # Client retry interval in milliseconds if connection drops
 SSE_KEEPALIVE_TIMEOUT = 5   # Keepalive interval in seconds
 LLM_REQUEST_TIMEOUT = 600   # LLM request timeout in seconds (10 minutes)
 
-# Print Configuration Summary
-print("\n=== Path Configuration ===")
-print(f"Output Directory: {OUTPUT_DIR}")
 
-print("\n=== Output File Paths ===")
-print(f"MLXW Output: {MLXW_OUTPUT_FILENAME}")
-print(f"Kokoro Output: {KOKORO_OUTPUT_FILENAME}")
-print(f"LLM Output: {LLM_OUTPUT_FILENAME}")
-print(f"Chat History: {CHAT_HISTORY_DIR}\n")
+def log_configuration() -> None:
+    """Print the configuration summary; called once by the CLI entry point."""
+    print(f"\n=== Configuration Initialization ===")
+    print(f"Looking for .env at: {env_path}")
+    print(f".env file exists: {env_path.exists()}\n")
+
+    print("\n=== Path Configuration ===")
+    print(f"Output Directory: {OUTPUT_DIR}")
+
+    print("\n=== Output File Paths ===")
+    print(f"MLXW Output: {MLXW_OUTPUT_FILENAME}")
+    print(f"Kokoro Output: {KOKORO_OUTPUT_FILENAME}")
+    print(f"LLM Output: {LLM_OUTPUT_FILENAME}")
+    print(f"Chat History: {CHAT_HISTORY_DIR}\n")
 
-print("\n=== Models ===")
-print(f"Whisper: {MODEL_NAME}")
-print(f"Kokoro: {KOKORO_MODEL} | {KOKORO_VOICE} | {KOKORO_SPEED}")
-print(f"LMStudio: {LLM_MODEL}\n\n")
\ No newline at end of file
+    print("\n=== Models ===")
+    print(f"Whisper: {MODEL_NAME}")
+    print(f"Kokoro: {KOKORO_MODEL} | {KOKORO_VOICE} | {KOKORO_SPEED}")
+    print(f"LMStudio: {LLM_MODEL}\n\n")
@@ -4,13 +4,32 @@ Configuration file containing text optimization rules for voice synthesis.
 These rules are used to enhance the quality of synthesized speech output.
 """
 
+import functools
 from dataclasses import dataclass, field
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
 import re
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-def get_default_abbreviations() -> Dict[str, str]:
-    return {
+# Texts shorter than this are cached; long LLM outputs rarely repeat
+OPTIMIZE_CACHE_MAX_LENGTH = 8192
+OPTIMIZE_CACHE_SIZE = 512
+
+# Runs of whitespace collapsed to a single space
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Pause between sentences that still end in a single period. The preceding
+# word character is captured rather than checked with a lookbehind.
+SENTENCE_PAUSE_PATTERN = re.compile(r"(\w)\.(?=\s+[A-Z])")
+
+
+# Read-only default rules, shared by every TextOptimizer instead of copied
+DEFAULT_ABBREVIATIONS: Mapping[str, str] = MappingProxyType(
+    {
         # "api": "A P I",
         "url": "U R L",
         "sql": "S Q L",
@@ -22,10 +41,10 @@ def get_default_abbreviations() -> Dict[str, str]:
         "ui": "U I",
         "ux": "U X",
     }
+)
 
-
-def get_default_char_replacements() -> Dict[str, str]:
-    return {
+DEFAULT_CHAR_REPLACEMENTS: Mapping[str, str] = MappingProxyType(
+    {
         "<|START_RESPONSE|>": "",  # Manually remove tokens
         "<|END_RESPONSE|>": "",
         "<<Start of article>>": "",
@@ -43,12 +62,208 @@ def get_default_char_replacements() -> Dict[str, str]:
         "|": ",",  # Natural pause
         "•": ",",  # Natural pause for bullets
     }
+)
 
-
-def get_default_pronunciations() -> Dict[str, str]:
-    return {
+DEFAULT_PRONUNCIATIONS: Mapping[str, str] = MappingProxyType(
+    {
         "pikachu": "peeka-chu",
     }
+)
+
+
+def compose_replacements(items: List[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    Apply each replacement's successors to its value.
+
+    Sequential str.replace calls also rewrite text inserted by earlier
+    replacements; composing the values lets a single simultaneous pass
+    produce the same result.
+
+    Args:
+        items: Ordered (target, replacement) pairs
+
+    Returns:
+        Dict[str, str]: Targets mapped to their composed replacements
+    """
+    composed = {}
+    for index, (target, replacement) in enumerate(items):
+        for later_target, later_replacement in items[index + 1 :]:
+            replacement = replacement.replace(later_target, later_replacement)
+        # A repeated target only rewrites earlier values; the first one wins
+        composed.setdefault(target, replacement)
+    return composed
+
+
+def character_class_members(pattern: str) -> Optional[str]:
+    """
+    Get the characters of a simple regex character class such as "[*#()]".
+
+    Args:
+        pattern: Regular expression to inspect
+
+    Returns:
+        Optional[str]: Member characters, or None if the pattern is not a
+            plain class (negated, ranges, or anything outside brackets)
+    """
+    if len(pattern) < 3 or pattern[0] != "[" or pattern[-1] != "]" or pattern[1] == "^":
+        return None
+
+    members = []
+    body = iter(pattern[1:-1])
+    for char in body:
+        if char == "\\":
+            char = next(body, "")
+            if not char or char.isalnum():
+                return None  # Class shorthands like \s or \d
+        elif char in "-[]":
+            return None
+        members.append(char)
+    return "".join(members)
+
+
+def compile_word_pattern(words: Mapping[str, str]) -> Optional[Pattern]:
+    """
+    Compile a case-insensitive whole-word alternation for dictionary keys.
+
+    Keys are tried longest first so a phrase wins over a shorter key it
+    starts with, matching the automaton's leftmost-longest choice.
+
+    Args:
+        words: Mapping whose keys should be matched
+
+    Returns:
+        Optional[Pattern]: Compiled pattern or None if there are no keys
+    """
+    if not words:
+        return None
+    return re.compile(
+        r"\b(" + "|".join(map(re.escape, sorted(words, key=len, reverse=True))) + r")\b",
+        re.IGNORECASE,
+    )
+
+
+def compile_word_substitution(words: Mapping[str, str]) -> Optional[Callable[[str], str]]:
+    """
+    Build a whole-word substitution function over dictionary keys.
+
+    The pattern and its replacement lookup are bound once, so each call is
+    a single regex pass with one dict probe per match.
+
+    Args:
+        words: Mapping of lowercase words to their replacements
+
+    Returns:
+        Optional[Callable[[str], str]]: Substitution function or None if
+            there are no keys
+    """
+    pattern = compile_word_pattern(words)
+    if pattern is None:
+        return None
+    lookup = words.__getitem__
+    return functools.partial(pattern.sub, lambda m: lookup(m.group().lower()))
+
+
+def build_word_automaton(words: Mapping[str, str]) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton over lowercased dictionary keys.
+
+    Args:
+        words: Mapping of lowercase words to their replacements
+
+    Returns:
+        Optional[Any]: Automaton, or None if pyahocorasick is not installed
+            or there are no keys
+    """
+    if ahocorasick is None or not words:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word, replacement in words.items():
+        automaton.add_word(word.lower(), (len(word), replacement))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a word character for regex word boundaries."""
+    return char.isalnum() or char == "_"
+
+
+def replace_with_automaton(automaton: Any, text: str) -> Optional[str]:
+    """
+    Replace whole-word, case-insensitive matches in one automaton scan.
+
+    Produces the same result as the equivalent word-bounded alternation:
+    matches must start and end on word boundaries, and the leftmost
+    (then longest) match wins where matches overlap.
+
+    Args:
+        automaton: Automaton from build_word_automaton
+        text: Input text
+
+    Returns:
+        Optional[str]: Text with replacements, or None if lowercasing
+            changes the text length and offsets cannot be mapped back
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        return None
+
+    def is_boundary(index: int) -> bool:
+        before = index > 0 and _is_word_char(text[index - 1])
+        after = index < len(text) and _is_word_char(text[index])
+        return before != after
+
+    matches = []
+    for end, (length, replacement) in automaton.iter(lowered):
+        start = end - length + 1
+        if is_boundary(start) and is_boundary(end + 1):
+            matches.append((start, -length, replacement))
+    if not matches:
+        return text
+
+    # Unchanged spans and replacements are collected and joined once
+    matches.sort()
+    pieces = []
+    append = pieces.append
+    last = 0
+    for start, negative_length, replacement in matches:
+        if start < last:
+            continue  # Overlaps a match already replaced
+        if start > last:
+            append(text[last:start])
+        append(replacement)
+        last = start - negative_length
+    append(text[last:])
+    return "".join(pieces)
+
+
+def replace_words(
+    text: str, automaton: Optional[Any], substitute: Optional[Callable[[str], str]]
+) -> str:
+    """
+    Replace whole words using the automaton when available, else the regex.
+
+    Args:
+        text: Input text
+        automaton: Optional automaton from build_word_automaton
+        substitute: Optional function from compile_word_substitution
+
+    Returns:
+        str: Text with replacements
+    """
+    if automaton is not None:
+        replaced = replace_with_automaton(automaton, text)
+        if replaced is not None:
+            return replaced
+    if substitute is None:
+        return text
+    return substitute(text)
+
+
+# Fields whose assignment requires recompiling the optimization rules
+_RULE_FIELDS = frozenset(
+    {"ABBREVIATIONS", "CHAR_REPLACEMENTS", "PRONUNCIATIONS", "CHARS_TO_REMOVE"}
+)
 
 
 @dataclass
@@ -57,16 +272,74 @@ class TextOptimizer:
     Handles text optimization for voice synthesis with clear separation of concerns.
     """
 
-    ABBREVIATIONS: Dict[str, str] = field(default_factory=get_default_abbreviations)
-    CHAR_REPLACEMENTS: Dict[str, str] = field(
-        default_factory=get_default_char_replacements
+    ABBREVIATIONS: Mapping[str, str] = field(default_factory=lambda: DEFAULT_ABBREVIATIONS)
+    CHAR_REPLACEMENTS: Mapping[str, str] = field(
+        default_factory=lambda: DEFAULT_CHAR_REPLACEMENTS
+    )
+    PRONUNCIATIONS: Mapping[str, str] = field(
+        default_factory=lambda: DEFAULT_PRONUNCIATIONS
     )
-    PRONUNCIATIONS: Dict[str, str] = field(default_factory=get_default_pronunciations)
     CHARS_TO_REMOVE: str = r"[*#`~\[\]()]"
 
+    def __post_init__(self):
+        """Compile the optimization rules into reusable patterns and tables."""
+        self._compile()
+        self._cached_optimize = functools.lru_cache(maxsize=OPTIMIZE_CACHE_SIZE)(
+            self._optimize
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Recompile the rules when a rule field is replaced after construction."""
+        super().__setattr__(name, value)
+        if name in _RULE_FIELDS and "_cached_optimize" in self.__dict__:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Recompile rules and drop cached results after the rules are changed."""
+        self._compile()
+        self._cached_optimize.cache_clear()
+
+    def _compile(self) -> None:
+        """Build compiled patterns and translation tables from the current rules."""
+        self._abbreviation_sub = compile_word_substitution(self.ABBREVIATIONS)
+        self._pronunciation_sub = compile_word_substitution(self.PRONUNCIATIONS)
+        # Single-scan matching when pyahocorasick is installed
+        self._abbreviation_automaton = build_word_automaton(self.ABBREVIATIONS)
+        self._pronunciation_automaton = build_word_automaton(self.PRONUNCIATIONS)
+
+        # Trailing single-character replacements are applied in one
+        # str.translate pass; everything before them is matched by one
+        # alternation scan
+        items = list(self.CHAR_REPLACEMENTS.items())
+        split = len(items)
+        while split and len(items[split - 1][0]) == 1:
+            split -= 1
+
+        self._replacement_map = compose_replacements(items[:split])
+        self._replace_chars = None
+        if self._replacement_map:
+            # Bind the substitution and its lookup once so each match costs
+            # a single dict probe rather than attribute lookups
+            lookup = self._replacement_map.__getitem__
+            self._replace_chars = functools.partial(
+                re.compile("|".join(map(re.escape, self._replacement_map))).sub,
+                lambda m: lookup(m.group()),
+            )
+
+        # Characters to remove join the same translate pass when CHARS_TO_REMOVE
+        # is a plain character class; other patterns keep a regex pass
+        translations = items[split:]
+        removed = character_class_members(self.CHARS_TO_REMOVE)
+        if removed is None:
+            self._remove_pattern = re.compile(self.CHARS_TO_REMOVE)
+        else:
+            self._remove_pattern = None
+            translations += [(char, " ") for char in removed]
+        self._translation_table = str.maketrans(compose_replacements(translations))
+
     def optimize(self, text: str) -> str:
         """
-        Optimize text for voice synthesis using a clear, sequential process.
+        Optimize text for voice synthesis, reusing results for repeated short text.
 
         Args:
             text: Input text to optimize
@@ -76,36 +349,44 @@ class TextOptimizer:
         """
         if not text:
             return text
+        if len(text) < OPTIMIZE_CACHE_MAX_LENGTH:
+            return self._cached_optimize(text)
+        return self._optimize(text)
+
+    def _optimize(self, text: str) -> str:
+        """
+        Optimize text for voice synthesis using a clear, sequential process.
+
+        Args:
+            text: Input text to optimize
+
+        Returns:
+            str: Optimized text for voice synthesis
+        """
 
         # 1. Replace abbreviations (case-insensitive)
-        pattern = r"\b(" + "|".join(map(re.escape, self.ABBREVIATIONS.keys())) + r")\b"
-        text = re.sub(
-            pattern,
-            lambda m: self.ABBREVIATIONS[m.group().lower()],
-            text,
-            flags=re.IGNORECASE,
+        text = replace_words(
+            text, self._abbreviation_automaton, self._abbreviation_sub
         )
 
         # 2. Replace characters for better speech flow
-        for char, replacement in self.CHAR_REPLACEMENTS.items():
-            text = text.replace(char, replacement)
+        if self._replace_chars:
+            text = self._replace_chars(text)
 
-        # 3. Remove unnecessary characters
-        text = re.sub(self.CHARS_TO_REMOVE, " ", text)
+        # 3. Remove unnecessary characters (single-character swaps and
+        # removals share one translate pass)
+        text = text.translate(self._translation_table)
+        if self._remove_pattern:
+            text = self._remove_pattern.sub(" ", text)
 
         # 4. Clean up whitespace and add natural pauses
-        text = " ".join(text.split())  # Normalize spaces
-        text = re.sub(
-            r"(?<=\w)\.(?=\s+[A-Z])", "... ", text
-        )  # Add pauses between sentences
+        text = WHITESPACE_PATTERN.sub(" ", text).strip()  # Normalize spaces
+        if "." in text:  # Skip the pattern scan when no sentence can end
+            text = SENTENCE_PAUSE_PATTERN.sub(r"\1... ", text)  # Add pauses between sentences
 
         # 5. Apply pronunciation optimizations (done last to preserve special characters)
-        pattern = r"\b(" + "|".join(map(re.escape, self.PRONUNCIATIONS.keys())) + r")\b"
-        text = re.sub(
-            pattern,
-            lambda m: self.PRONUNCIATIONS[m.group().lower()],
-            text,
-            flags=re.IGNORECASE,
+        text = replace_words(
+            text, self._pronunciation_automaton, self._pronunciation_sub
         )
 
         return text
@@ -4,6 +4,6 @@ Kokoro package for text-to-speech conversion.
 Exposes the KokoroHandler class for text-to-speech functionality.
 """
 
-from .mlxw_to_kokoro import KokoroHandler
+from .mlxw_to_kokoro import KokoroHandler, get_kokoro_handler
 
-__all__ = ["KokoroHandler"]
+__all__ = ["KokoroHandler", "get_kokoro_handler"]
@@ -4,13 +4,27 @@ Kokoro text-to-speech integration for converting transcribed text to speech.
 Handles the conversion of text to speech using the Kokoro API.
 """
 
+import atexit
+import functools
+import hashlib
+import importlib.util
+import itertools
 import logging
 import os
-from typing import Optional
-import pyaudio
-from openai import OpenAI
+import re
+import shutil
+import wave
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Queue
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, BinaryIO, Deque, List, Optional, Union
 from requests.exceptions import Timeout
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+from speech_to_text.config.bootstrap import directories_ready
 from speech_to_text.config.settings import (
     KOKORO_BASE_URL,
     KOKORO_API_KEY,
@@ -19,56 +33,332 @@ from speech_to_text.config.settings import (
     KOKORO_SPEED,
     KOKORO_RESPONSE_FORMAT,
     KOKORO_OUTPUT_FILENAME,
+    KOKORO_CACHE_DIR,
+    KOKORO_CACHE_MAX_BYTES,
+    KOKORO_PREFETCH_SENTENCES,
+    KOKORO_PYAUDIO_FRAMES_PER_BUFFER,
     OUTPUT_DIR,
     LLM_REQUEST_TIMEOUT,
 )
 from speech_to_text.config.text_optimizations import optimizer
 
+# Response chunk size and file buffer used when saving synthesized audio
+_AUDIO_CHUNK_SIZE = 64 * 1024
+_AUDIO_FILE_BUFFER = 1 << 20
+
+# Kokoro PCM output: 24kHz mono 16-bit
+_PCM_SAMPLE_RATE = 24000
+# Live PCM is written in 2048-frame blocks, several periods per write call
+_PCM_WRITE_SIZE = 4096
+# Blocks buffered between the network reader and the playback thread;
+# a full queue makes the reader wait so memory stays bounded
+_PCM_QUEUE_SIZE = 8
+# Seconds close() waits for stopped playback to release the output stream
+_PLAYBACK_STOP_TIMEOUT = 2.0
+
+# Keep-alive pool of the shared Kokoro HTTP client. HTTP/2 is used when
+# the optional h2 package is installed.
+_HTTP_KEEPALIVE_CONNECTIONS = 4
+_HTTP_KEEPALIVE_EXPIRY = 60.0
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Synthesized sentences kept for repeated phrases ("Sure!", "Done."), bounded
+# by entry count and by total PCM size (about 11 minutes of audio)
+_PCM_CACHE_SIZE = 64
+_PCM_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Sentence boundaries used to pipeline synthesis with playback
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def _synthesis_key(text: str) -> str:
+    """
+    Build a cache key for text synthesized with the current model and voice.
+
+    Args:
+        text: Text converted to speech
+
+    Returns:
+        str: Hex digest of the model, voice, speed and text
+    """
+    return hashlib.blake2b(
+        f"{KOKORO_MODEL}|{KOKORO_VOICE}|{KOKORO_SPEED}|{text}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _audio_cache_path(text: str) -> str:
+    """
+    Get the disk cache path for audio synthesized from text with the current voice.
+
+    Args:
+        text: Text converted to speech
+
+    Returns:
+        str: Path of the cached audio file, whether or not it exists
+    """
+    return os.path.join(KOKORO_CACHE_DIR, f"{_synthesis_key(text)}.{KOKORO_RESPONSE_FORMAT}")
+
+
+def _open_wav_writer(file_path: Union[str, BinaryIO]) -> wave.Wave_write:
+    """
+    Open a WAV file for Kokoro's 24kHz mono 16-bit PCM audio.
+
+    Args:
+        file_path: Destination audio file or open binary file
+
+    Returns:
+        wave.Wave_write: Writer with the PCM format set
+    """
+    out = wave.open(file_path, "wb")
+    out.setnchannels(1)
+    out.setsampwidth(2)
+    out.setframerate(_PCM_SAMPLE_RATE)
+    return out
+
+
+def _evict_audio_cache() -> None:
+    """Delete the least recently used cached audio files beyond the size budget."""
+    try:
+        entries = [entry for entry in os.scandir(KOKORO_CACHE_DIR) if entry.is_file()]
+        total = sum(entry.stat().st_size for entry in entries)
+        if total <= KOKORO_CACHE_MAX_BYTES:
+            return
+
+        # Oldest first; cache hits refresh a file's mtime
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+            if total <= KOKORO_CACHE_MAX_BYTES:
+                break
+    except Exception as e:
+        logging.warning(f"Error evicting Kokoro audio cache: {e}")
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences for incremental speech synthesis.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List[str]: Non-empty sentences in order
+    """
+    return [sentence for sentence in _SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+
 
 class KokoroHandler:
     """Handles text-to-speech conversion using the Kokoro API."""
 
     def __init__(self):
-        """Initialize the Kokoro handler with OpenAI client."""
-        self.client = OpenAI(
-            base_url=KOKORO_BASE_URL, 
+        """Initialize the Kokoro handler; the OpenAI client is created on first use."""
+        # Synthesizes upcoming sentences while the current one plays;
+        # started on first playback and shut down by close()
+        self._tts_executor: Optional[ThreadPoolExecutor] = None
+        self._pcm_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._pcm_cache_bytes = 0
+        self._pcm_cache_lock = Lock()
+        # Output stream opened on first playback and kept for later calls;
+        # the stream lock only guards opening and swapping it out
+        self._audio = None
+        self._stream = None
+        self._stream_lock = Lock()
+        # One response plays at a time; close() stops it through the event
+        self._playback_lock = Lock()
+        self._stop_playback = Event()
+        self._ensure_output_directory()
+        atexit.register(self.close)
+
+    def __enter__(self) -> "KokoroHandler":
+        """Use the handler as a context manager that closes its audio stream."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the audio stream on leaving the context."""
+        self.close()
+
+    def _get_stream(self):
+        """
+        Get the shared PCM output stream, opening PortAudio on first use.
+
+        The stream uses an explicit small period rather than PortAudio's
+        default buffering, which favors reliability over latency.
+
+        Returns:
+            pyaudio.Stream: Open 24kHz mono 16-bit output stream
+        """
+        with self._stream_lock:
+            if self._stream is None:
+                # Imported here so text-only paths skip PortAudio
+                import pyaudio
+
+                self._audio = pyaudio.PyAudio()
+                self._stream = self._audio.open(
+                    format=pyaudio.paInt16,
+                    channels=1,
+                    rate=_PCM_SAMPLE_RATE,
+                    output=True,
+                    frames_per_buffer=KOKORO_PYAUDIO_FRAMES_PER_BUFFER,
+                )
+            return self._stream
+
+    def _get_tts_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the sentence prefetch pool, starting it on first use.
+
+        Returns:
+            ThreadPoolExecutor: Pool that synthesizes upcoming sentences
+        """
+        if self._tts_executor is None:
+            self._tts_executor = ThreadPoolExecutor(
+                max_workers=KOKORO_PREFETCH_SENTENCES, thread_name_prefix="kokoro-prefetch"
+            )
+        return self._tts_executor
+
+    def close(self) -> None:
+        """Stop any playback, then close the output stream, prefetch pool and Kokoro HTTP client."""
+        self._stop_playback.set()
+        # Stopped playback only finishes its current block, so this wait is short
+        stopped = self._playback_lock.acquire(timeout=_PLAYBACK_STOP_TIMEOUT)
+        try:
+            self._close_stream()
+        finally:
+            executor, self._tts_executor = self._tts_executor, None
+            if stopped:
+                self._playback_lock.release()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        client = self.__dict__.pop("client", None)
+        if client is not None:
+            client.close()
+
+    def _close_stream(self) -> None:
+        """Close the shared output stream and release PortAudio."""
+        with self._stream_lock:
+            stream, audio = self._stream, self._audio
+            self._stream = self._audio = None
+        try:
+            if stream is not None:
+                stream.stop_stream()
+                stream.close()
+            if audio is not None:
+                audio.terminate()
+        except Exception as e:
+            logging.error(f"Error closing audio stream: {e}")
+
+    @functools.cached_property
+    def client(self) -> "OpenAI":
+        """OpenAI client for the Kokoro API, imported and created on first use."""
+        import httpx
+        from openai import DefaultHttpxClient, OpenAI
+
+        # One pooled connection is kept warm and reused by every request
+        http_client = DefaultHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=_HTTP_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        return OpenAI(
+            base_url=KOKORO_BASE_URL,
             api_key=KOKORO_API_KEY,
             timeout=LLM_REQUEST_TIMEOUT,
+            http_client=http_client,
         )
-        self._ensure_output_directory()
 
     def _ensure_output_directory(self) -> None:
         """Ensure the output directory exists."""
+        if directories_ready():
+            return
         try:
             os.makedirs(OUTPUT_DIR, exist_ok=True)
+            if KOKORO_CACHE_MAX_BYTES:
+                os.makedirs(KOKORO_CACHE_DIR, exist_ok=True)
         except Exception as e:
             logging.error(f"Error creating output directory: {e}")
             raise
 
-    def _save_audio_to_file(self, text: str, optimize: bool = False) -> Optional[str]:
+    def _save_audio_to_file(self, text: str) -> Optional[str]:
         """
         Save audio to file using Kokoro API.
 
+        Audio previously synthesized for the same text and voice settings is
+        copied from the disk cache instead of being requested again.
+
+        Args:
+            text: Text to convert to speech, already optimized by the caller
+
+        Returns:
+            Optional[str]: Path to saved file if successful, None otherwise
+        """
+        if not KOKORO_CACHE_MAX_BYTES:
+            return self._synthesize_to_file(text, KOKORO_OUTPUT_FILENAME)
+
+        cache_path = _audio_cache_path(text)
+        try:
+            if os.path.exists(cache_path):
+                os.utime(cache_path)  # Mark as recently used
+                shutil.copyfile(cache_path, KOKORO_OUTPUT_FILENAME)
+                logging.debug(f"Using cached audio: {cache_path}")
+                return KOKORO_OUTPUT_FILENAME
+        except Exception as e:
+            logging.warning(f"Error reading cached audio, synthesizing again: {e}")
+
+        # Write to a temporary name so a failed request never leaves a partial
+        # file under the cache key
+        partial_path = f"{cache_path}.part"
+        if not self._synthesize_to_file(text, partial_path):
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            return None
+        try:
+            os.replace(partial_path, cache_path)
+            shutil.copyfile(cache_path, KOKORO_OUTPUT_FILENAME)
+        except Exception as e:
+            logging.error(f"Error saving audio to file: {e}")
+            return None
+        _evict_audio_cache()
+        return KOKORO_OUTPUT_FILENAME
+
+    def _synthesize_to_file(self, text: str, file_path: str) -> Optional[str]:
+        """
+        Synthesize speech with Kokoro API and write it to a file.
+
+        WAV output is requested as raw PCM and given its header locally,
+        which skips encoding on the server.
+
         Args:
             text: Text to convert to speech
-            optimize: Whether to apply voice optimization
+            file_path: Destination audio file
 
         Returns:
             Optional[str]: Path to saved file if successful, None otherwise
         """
+        as_wav = KOKORO_RESPONSE_FORMAT == "wav"
         try:
             with self.client.audio.speech.with_streaming_response.create(
                 model=KOKORO_MODEL,
                 voice=KOKORO_VOICE,
                 speed=KOKORO_SPEED,
                 input=text,
-                response_format=KOKORO_RESPONSE_FORMAT,
+                response_format="pcm" if as_wav else KOKORO_RESPONSE_FORMAT,
             ) as response:
                 logging.debug(
                     f"Saving audio response to file - Status: {response.status_code}"
                 )
-                response.stream_to_file(KOKORO_OUTPUT_FILENAME)
-                return KOKORO_OUTPUT_FILENAME
+                # Large chunks and a large file buffer keep per-chunk overhead
+                # and write syscalls low for long responses
+                with open(file_path, "wb", buffering=_AUDIO_FILE_BUFFER) as out:
+                    if as_wav:
+                        with _open_wav_writer(out) as wav:
+                            for chunk in response.iter_bytes(chunk_size=_AUDIO_CHUNK_SIZE):
+                                wav.writeframesraw(chunk)
+                    else:
+                        for chunk in response.iter_bytes(chunk_size=_AUDIO_CHUNK_SIZE):
+                            out.write(chunk)
+                return file_path
         except Timeout:
             logging.error(f"Timeout occurred while saving audio to file (timeout: {LLM_REQUEST_TIMEOUT}s)")
             return None
@@ -76,6 +366,113 @@ class KokoroHandler:
             logging.error(f"Error saving audio to file: {e}")
             return None
 
+    def _get_cached_pcm(self, text: str) -> Optional[bytes]:
+        """
+        Get previously synthesized PCM audio for text.
+
+        Args:
+            text: Text that was converted to speech
+
+        Returns:
+            Optional[bytes]: Cached PCM audio or None if not cached
+        """
+        key = _synthesis_key(text)
+        with self._pcm_cache_lock:
+            pcm = self._pcm_cache.get(key)
+            if pcm is not None:
+                self._pcm_cache.move_to_end(key)
+        return pcm
+
+    def _cache_pcm(self, text: str, pcm: bytes) -> None:
+        """
+        Store synthesized PCM audio, evicting least recently used entries.
+
+        Args:
+            text: Text that was converted to speech
+            pcm: Synthesized PCM audio
+        """
+        if len(pcm) > _PCM_CACHE_MAX_BYTES:
+            return
+        key = _synthesis_key(text)
+        with self._pcm_cache_lock:
+            previous = self._pcm_cache.pop(key, None)
+            if previous is not None:
+                self._pcm_cache_bytes -= len(previous)
+            self._pcm_cache[key] = pcm
+            self._pcm_cache_bytes += len(pcm)
+            while (
+                len(self._pcm_cache) > _PCM_CACHE_SIZE
+                or self._pcm_cache_bytes > _PCM_CACHE_MAX_BYTES
+            ):
+                _, evicted = self._pcm_cache.popitem(last=False)
+                self._pcm_cache_bytes -= len(evicted)
+
+    def _play_queued(
+        self, stream, chunks: "Queue[Optional[bytes]]", errors: List[Exception]
+    ) -> None:
+        """
+        Write queued PCM blocks to the output stream until the end marker.
+
+        Args:
+            stream: Open PyAudio output stream
+            chunks: PCM blocks to play, terminated by None
+            errors: Collects a playback error for the producing thread
+        """
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if errors or self._stop_playback.is_set():
+                continue  # Keep draining so the producer never blocks
+            try:
+                stream.write(chunk)
+            except Exception as e:
+                errors.append(e)
+
+    def _save_pcm_to_file(self, segments: List[bytes]) -> Optional[str]:
+        """
+        Save already synthesized PCM audio as a WAV output file.
+
+        Args:
+            segments: 24kHz mono 16-bit PCM audio, in playback order
+
+        Returns:
+            Optional[str]: Path to saved file if successful, None otherwise
+        """
+        try:
+            with _open_wav_writer(KOKORO_OUTPUT_FILENAME) as out:
+                out.writeframes(b"".join(segments))
+            logging.info(f"Audio saved to: {KOKORO_OUTPUT_FILENAME}")
+            return KOKORO_OUTPUT_FILENAME
+        except Exception as e:
+            logging.error(f"Error saving audio to file: {e}")
+            return None
+
+    def _fetch_pcm(self, text: str) -> bytes:
+        """
+        Synthesize text to raw PCM audio using Kokoro API.
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            bytes: 24kHz mono 16-bit PCM audio
+        """
+        pcm = self._get_cached_pcm(text)
+        if pcm is not None:
+            return pcm
+
+        with self.client.audio.speech.with_streaming_response.create(
+            model=KOKORO_MODEL,
+            voice=KOKORO_VOICE,
+            speed=KOKORO_SPEED,
+            input=text,
+            response_format="pcm",
+        ) as response:
+            pcm = response.read()
+        self._cache_pcm(text, pcm)
+        return pcm
+
     def convert_text_to_speech(
         self, text: str, optimize: bool = False
     ) -> Optional[str]:
@@ -107,7 +504,7 @@ class KokoroHandler:
                 f"Request parameters - Model: {KOKORO_MODEL}, Voice: {KOKORO_VOICE}, Format: {KOKORO_RESPONSE_FORMAT}"
             )
 
-            return self._save_audio_to_file(text, optimize)
+            return self._save_audio_to_file(text)
 
         except Exception as e:
             logging.error(f"Error during text-to-speech conversion: {e}")
@@ -139,12 +536,6 @@ class KokoroHandler:
                 text = optimizer(text)
                 logging.debug(f"Optimized text: {text}")
 
-            # Initialize PyAudio
-            audio = pyaudio.PyAudio()
-            stream = audio.open(
-                format=pyaudio.paInt16, channels=1, rate=24000, output=True
-            )
-
             logging.debug(
                 f"Making streaming request to Kokoro API - URL: {KOKORO_BASE_URL}/audio/speech"
             )
@@ -152,37 +543,111 @@ class KokoroHandler:
                 f"Request parameters - Model: {KOKORO_MODEL}, Voice: {KOKORO_VOICE}, Format: pcm"
             )
 
-            # Stream to speakers
+            # Stream the first sentence live and synthesize the following
+            # sentences in the background while earlier ones play
+            sentences = _split_sentences(text) or [text]
+            upcoming = iter(sentences[1:])
+            pending: Deque[Future] = deque()
+            # PCM of every sentence, kept to write the WAV output file
+            segments: List[bytes] = []
+            # Playback runs on its own thread so network reads and
+            # synthesis never wait on blocking stream writes
+            chunks: "Queue[Optional[bytes]]" = Queue(maxsize=_PCM_QUEUE_SIZE)
+            playback_errors: List[Exception] = []
+            writer: Optional[Thread] = None
+            stopped = False
+            self._playback_lock.acquire()
+            self._stop_playback.clear()
             try:
-                with self.client.audio.speech.with_streaming_response.create(
-                    model=KOKORO_MODEL,
-                    voice=KOKORO_VOICE,
-                    speed=KOKORO_SPEED,
-                    input=text,
-                    response_format="pcm",  # Use PCM format for direct streaming
-                ) as response:
-                    logging.debug(
-                        f"Received streaming response - Status: {response.status_code}"
-                    )
-                    for chunk in response.iter_bytes(chunk_size=1024):
-                        stream.write(chunk)
+                executor = self._get_tts_executor()
+                writer = Thread(
+                    target=self._play_queued,
+                    args=(self._get_stream(), chunks, playback_errors),
+                    name="kokoro-playback",
+                    daemon=True,
+                )
+                writer.start()
+                for sentence in itertools.islice(upcoming, KOKORO_PREFETCH_SENTENCES):
+                    pending.append(executor.submit(self._fetch_pcm, sentence))
+
+                pcm = self._get_cached_pcm(sentences[0])
+                if pcm is not None:
+                    chunks.put(pcm)
+                    segments.append(pcm)
+                else:
+                    with self.client.audio.speech.with_streaming_response.create(
+                        model=KOKORO_MODEL,
+                        voice=KOKORO_VOICE,
+                        speed=KOKORO_SPEED,
+                        input=sentences[0],
+                        response_format="pcm",  # Use PCM format for direct streaming
+                    ) as response:
+                        logging.debug(
+                            f"Received streaming response - Status: {response.status_code}"
+                        )
+                        # iter_bytes coalesces network reads into full
+                        # blocks, so each write hands PortAudio whole frames.
+                        # The queued blocks are also kept and joined once.
+                        played: List[bytes] = []
+                        for chunk in response.iter_bytes(chunk_size=_PCM_WRITE_SIZE):
+                            if self._stop_playback.is_set():
+                                break
+                            chunks.put(chunk)
+                            played.append(chunk)
+                    segments.append(b"".join(played))
+                    if not self._stop_playback.is_set():
+                        self._cache_pcm(sentences[0], segments[0])
+
+                # Play prefetched sentences in order, keeping the look-ahead full
+                while pending and not self._stop_playback.is_set():
+                    pcm = pending.popleft().result()
+                    for sentence in itertools.islice(upcoming, 1):
+                        pending.append(executor.submit(self._fetch_pcm, sentence))
+                    chunks.put(pcm)
+                    segments.append(pcm)
             except Timeout:
                 logging.error(f"Timeout occurred during streaming (timeout: {LLM_REQUEST_TIMEOUT}s)")
                 return None
             finally:
-                # Clean up audio stream
-                stream.stop_stream()
-                stream.close()
-                audio.terminate()
+                for future in pending:
+                    future.cancel()
+                if writer is not None:
+                    chunks.put(None)
+                    writer.join()
+                stopped = self._stop_playback.is_set()
+                self._playback_lock.release()
+
+            if stopped:
+                logging.info("Speaker playback stopped")
+                return None
+
+            if playback_errors:
+                raise playback_errors[0]
 
             logging.debug("Successfully streamed text to speakers")
 
-            # Save to file if requested
+            # Save to file if requested. WAV output reuses the streamed PCM;
+            # compressed formats need a second request to encode.
             if save_to_file:
                 logging.debug("Saving streamed audio to file...")
-                return self._save_audio_to_file(text, optimize)
+                if KOKORO_RESPONSE_FORMAT == "wav":
+                    return self._save_pcm_to_file(segments)
+                return self._save_audio_to_file(text)
             return None
 
         except Exception as e:
             logging.error(f"Error during text-to-speech streaming: {e}")
-            return None
\ No newline at end of file
+            # Reopen the output stream on the next call in case it failed
+            self._close_stream()
+            return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_kokoro_handler() -> KokoroHandler:
+    """
+    Get the process-wide Kokoro handler, creating it on first use.
+
+    Returns:
+        KokoroHandler: Shared Kokoro handler instance
+    """
+    return KokoroHandler()
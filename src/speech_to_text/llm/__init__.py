@@ -4,7 +4,8 @@ LLM module for speech-to-text application.
 Provides LLM integration and file processing capabilities.
 """
 
-from .mlxw_to_llm import MLXWToLLM
+from .mlxw_to_llm import MLXWToLLM, get_llm_handler
 from .file_handler import process_file, prepare_content_message
+from .history_reducer import reduce_history
 
-__all__ = ['MLXWToLLM', 'process_file', 'prepare_content_message']
\ No newline at end of file
+__all__ = ['MLXWToLLM', 'get_llm_handler', 'process_file', 'prepare_content_message', 'reduce_history']
\ No newline at end of file
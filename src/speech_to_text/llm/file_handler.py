@@ -4,18 +4,45 @@ File handler for processing different document types.
 Supports text files, PDFs, and images for LLM processing.
 """
 
+import functools
+import io
 import logging
 import base64
 import mimetypes
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Optional, Dict, Any, Union, Tuple
 from PIL import Image
 import pymupdf4llm
 
+# Worker processes for PDF conversion, which is CPU-bound
+_PDF_POOL_WORKERS = min(4, os.cpu_count() or 2)
+
+# Text documents are truncated beyond this size
+MAX_TEXT_BYTES = 8 * 1024 * 1024
+
+# Formats sent to the LLM as-is when already in a supported color mode
+_PASSTHROUGH_IMAGE_FORMATS = ('JPEG', 'PNG', 'WEBP')
+
 def get_file_type(file_path: Union[str, Path]) -> Optional[str]:
     """
     Determine file type from path.
     
+    Args:
+        file_path: Path to file
+        
+    Returns:
+        Optional[str]: MIME type of file or None if unknown
+    """
+    return _guess_file_type(str(file_path))
+
+@functools.lru_cache(maxsize=256)
+def _guess_file_type(file_path: str) -> Optional[str]:
+    """
+    Guess and remember the MIME type of a file path.
+    
     Args:
         file_path: Path to file
         
@@ -23,7 +50,7 @@ def get_file_type(file_path: Union[str, Path]) -> Optional[str]:
         Optional[str]: MIME type of file or None if unknown
     """
     try:
-        mime_type, _ = mimetypes.guess_type(str(file_path))
+        mime_type, _ = mimetypes.guess_type(file_path)
         if mime_type:
             return mime_type
         return None
@@ -35,6 +62,9 @@ def process_text_file(file_path: Union[str, Path]) -> Optional[str]:
     """
     Process text files (txt, md, etc).
     
+    Files larger than MAX_TEXT_BYTES are truncated, and invalid UTF-8
+    sequences are replaced rather than failing the read.
+    
     Args:
         file_path: Path to text file
         
@@ -42,16 +72,35 @@ def process_text_file(file_path: Union[str, Path]) -> Optional[str]:
         Optional[str]: File contents or None if error
     """
     try:
-        content = Path(file_path).read_text(encoding='utf-8')
+        with open(file_path, 'rb') as f:
+            data = f.read(MAX_TEXT_BYTES)
+            if f.read(1):
+                logging.warning(
+                    f"Text file exceeds {MAX_TEXT_BYTES} bytes, truncating: {file_path}"
+                )
+        content = data.decode('utf-8', errors='replace')
         return f"[File Type: Text Document]\n\n{content}"
     except Exception as e:
         logging.error(f"Error reading text file: {e}")
         return None
 
+@functools.lru_cache(maxsize=1)
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool for PDF conversion, starting it on first use.
+    
+    Returns:
+        ProcessPoolExecutor: Shared PDF conversion pool
+    """
+    return ProcessPoolExecutor(max_workers=_PDF_POOL_WORKERS)
+
 def process_pdf_file(file_path: Union[str, Path]) -> Optional[str]:
     """
     Convert PDF to markdown text.
     
+    Conversion runs in a worker process so it does not hold the GIL while
+    recording and other threads run, and several PDFs convert in parallel.
+    
     Args:
         file_path: Path to PDF file
         
@@ -59,12 +108,42 @@ def process_pdf_file(file_path: Union[str, Path]) -> Optional[str]:
         Optional[str]: Markdown text or None if error
     """
     try:
-        markdown_text = pymupdf4llm.to_markdown(str(file_path))
+        try:
+            markdown_text = _get_pdf_pool().submit(
+                pymupdf4llm.to_markdown, str(file_path)
+            ).result()
+        except BrokenProcessPool:
+            # A crashed worker breaks the pool; start a new one next time
+            logging.warning("PDF conversion worker failed, converting in-process")
+            _get_pdf_pool.cache_clear()
+            markdown_text = pymupdf4llm.to_markdown(str(file_path))
         return f"[File Type: PDF Document]\n\n{markdown_text}"
     except Exception as e:
         logging.error(f"Error converting PDF: {e}")
         return None
 
+def _image_content(img_format: str, image_bytes: Union[bytes, memoryview]) -> Dict[str, Any]:
+    """
+    Build the LLM API content object for encoded image bytes.
+    
+    Args:
+        img_format: PIL image format name (e.g. 'JPEG')
+        image_bytes: Encoded image file contents or a view of them
+        
+    Returns:
+        Dict[str, Any]: Image content object with a base64 data URL
+    """
+    # Convert to base64
+    base64_img = base64.b64encode(image_bytes).decode('utf-8')
+    
+    # Create content object for API
+    return {
+        "type": "image_url",
+        "image_url": {
+            "url": f"data:image/{img_format.lower()};base64,{base64_img}"
+        }
+    }
+
 def process_image_file(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
     """
     Process image files to base64.
@@ -76,8 +155,13 @@ def process_image_file(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
         Optional[Dict]: Image content object for LLM API or None if error
     """
     try:
-        # Open and verify image
+        # Open and verify image (only the header is read here)
         with Image.open(file_path) as img:
+            # Send the original file when no conversion is needed, skipping
+            # a full decode and re-encode
+            if img.mode in ('RGB', 'L') and img.format in _PASSTHROUGH_IMAGE_FORMATS:
+                return _image_content(img.format, Path(file_path).read_bytes())
+
             # Convert to RGB if needed
             if img.mode not in ('RGB', 'L'):
                 img = img.convert('RGB')
@@ -85,26 +169,28 @@ def process_image_file(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
             # Get image format
             img_format = img.format or 'JPEG'
             
-            # Save to bytes
-            import io
+            # Save to bytes, encoding straight from the buffer's memory
+            # rather than copying it out with getvalue()
             img_byte_arr = io.BytesIO()
             img.save(img_byte_arr, format=img_format)
-            img_byte_arr = img_byte_arr.getvalue()
-            
-            # Convert to base64
-            base64_img = base64.b64encode(img_byte_arr).decode('utf-8')
             
-            # Create content object for API
-            return {
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/{img_format.lower()};base64,{base64_img}"
-                }
-            }
+            return _image_content(img_format, img_byte_arr.getbuffer())
     except Exception as e:
         logging.error(f"Error processing image file: {e}")
         return None
 
+# Handlers for common extensions, checked before the MIME type lookup
+_EXTENSION_HANDLERS = {
+    '.txt': (process_text_file, False),
+    '.md': (process_text_file, False),
+    '.pdf': (process_pdf_file, False),
+    '.png': (process_image_file, True),
+    '.jpg': (process_image_file, True),
+    '.jpeg': (process_image_file, True),
+    '.webp': (process_image_file, True),
+    '.gif': (process_image_file, True),
+}
+
 def process_file(file_path: Union[str, Path]) -> Tuple[Optional[Union[str, Dict]], bool]:
     """
     Process file based on its type.
@@ -118,6 +204,11 @@ def process_file(file_path: Union[str, Path]) -> Tuple[Optional[Union[str, Dict]
             - Boolean indicating if content is an image
     """
     try:
+        handler = _EXTENSION_HANDLERS.get(Path(file_path).suffix.lower())
+        if handler:
+            process, is_image = handler
+            return process(file_path), is_image
+
         mime_type = get_file_type(file_path)
         if not mime_type:
             logging.error(f"Unknown file type: {file_path}")
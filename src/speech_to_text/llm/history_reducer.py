@@ -0,0 +1,94 @@
+# File: src/speech_to_text/llm/history_reducer.py
+"""
+Chat history reduction for LLM requests.
+Bounds the conversation sent with each turn to an approximate token budget.
+"""
+
+import logging
+from operator import itemgetter
+from typing import Any, Dict, List
+
+from speech_to_text.config.settings import LLM_MAX_HISTORY_TOKENS
+
+# Conversation messages are dropped in blocks of this many, so the kept
+# history (and the server's cached prefix) only shifts every few turns
+_HISTORY_TRIM_STEP = 8
+
+# Approximate per-message overhead of role and formatting tokens
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+_get_role = itemgetter("role")
+
+
+def estimate_tokens(message: Dict[str, Any]) -> int:
+    """
+    Estimate the tokens of a chat message at roughly four characters per token.
+
+    Args:
+        message: Chat message with string or content-block content
+
+    Returns:
+        int: Approximate token count
+    """
+    content = message.get("content")
+    if isinstance(content, str):
+        chars = len(content)
+    elif isinstance(content, list):
+        chars = sum(
+            len(block.get("text", "")) for block in content if isinstance(block, dict)
+        )
+    else:
+        chars = 0
+    return chars // 4 + _MESSAGE_OVERHEAD_TOKENS
+
+
+def reduce_history(
+    message_history: List[Dict[str, Any]],
+    max_tokens: int = LLM_MAX_HISTORY_TOKENS,
+    max_messages: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Drop the oldest conversation messages to fit the history into a budget.
+
+    Leading system messages are always kept, and the kept conversation
+    starts on a user message so exchanges are not split.
+
+    Args:
+        message_history: Messages with system messages first
+        max_tokens: Approximate token budget for the whole history (0 = unlimited)
+        max_messages: Maximum conversation messages to keep (0 = unlimited)
+
+    Returns:
+        List[Dict[str, Any]]: The history itself if it fits, otherwise a
+            reduced copy
+    """
+    if not max_tokens and not max_messages:
+        return message_history
+
+    system_count = 0
+    for msg in message_history:
+        if _get_role(msg) != "system":
+            break
+        system_count += 1
+    conversation = message_history[system_count:]
+
+    drop = max(0, len(conversation) - max_messages) if max_messages else 0
+    if max_tokens:
+        costs = [estimate_tokens(msg) for msg in conversation]
+        budget = max_tokens - sum(
+            estimate_tokens(msg) for msg in message_history[:system_count]
+        )
+        remaining = sum(costs[drop:])
+        while drop < len(conversation) and remaining > budget:
+            remaining -= costs[drop]
+            drop += 1
+    if not drop:
+        return message_history
+
+    # Round up to a whole block, then advance to the next user message
+    drop = min(len(conversation), -(-drop // _HISTORY_TRIM_STEP) * _HISTORY_TRIM_STEP)
+    while drop < len(conversation) and _get_role(conversation[drop]) != "user":
+        drop += 1
+
+    logging.debug(f"Dropped {drop} oldest message(s) from chat history sent to LLM")
+    return message_history[:system_count] + conversation[drop:]
@@ -4,35 +4,265 @@ Alternative LLM integration for processing transcribed text.
 Implements a simpler request structure matching direct API calls.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import logging
-import json
+import os
+import random
 import requests
+import time
+import uuid
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from threading import Event, Lock, Timer
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, Iterator, Set, TextIO, Tuple, Union
 
 from .file_handler import process_file, prepare_content_message
+from .history_reducer import reduce_history
+from .semantic_cache import SemanticCache, semantic_cache_available
 from speech_to_text.config.settings import (
     LLM_BASE_URL,
     LLM_MODEL,
+    LLM_MAX_CONCURRENCY,
     LLM_MAX_TOKENS,
     LLM_TEMPERATURE,
     LLM_OUTPUT_FILENAME,
+    LLM_PROMPT_CACHE_CONTROL,
+    LLM_RESPONSE_CACHE,
     LLM_REQUEST_TIMEOUT,
+    LLM_SEMANTIC_CACHE,
+    LLM_SEMANTIC_CACHE_DIR,
+    LLM_SEMANTIC_CACHE_MODEL,
+    LLM_SEMANTIC_CACHE_THRESHOLD,
     OUTPUT_DIR,
 )
-from speech_to_text.utils.path_utils import ensure_directory, safe_write_file
+from speech_to_text.config.bootstrap import directories_ready
+from speech_to_text.utils.json_utils import json_dumps, json_loads
+from speech_to_text.utils.path_utils import ensure_directory
+
+
+# Connection pool of the shared LLM session; transient gateway errors on
+# idempotent requests are retried with backoff
+_HTTP_POOL_CONNECTIONS = 4
+_HTTP_POOL_MAXSIZE = 16
+_HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+
+# Chat completion POSTs are not retried by the adapter; rate limits and
+# server errors are retried here, honoring Retry-After when the server sends it
+_CHAT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_CHAT_RETRIES = 3
+_CHAT_RETRY_BACKOFF = 1.0
+_CHAT_RETRY_MAX_DELAY = 30.0
+
+# Base delay before process_many() retries failed prompts; doubles per attempt
+_BATCH_RETRY_BACKOFF = 0.5
+
+# Processed documents kept across chat turns, keyed by path, mtime and size
+_DOC_CACHE_SIZE = 32
+
+# Endpoints and headers shared by every request of the session
+_CHAT_URL = f"{LLM_BASE_URL}/chat/completions"
+_MODELS_URL = f"{LLM_BASE_URL}/models"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_get_role = itemgetter("role")
+
+# Marks the end of a response stream handed to the event loop
+_STREAM_END = object()
+
+# Fixed text around document context in the system message
+_DOC_PREFIX = "<<DOCUMENT CONTEXT>>\n"
+_DOC_SUFFIX = (
+    "\n<<END DOCUMENT CONTEXT>>\n\n"
+    "Consider the above document context when responding to queries. "
+    "You can reference specific parts when relevant."
+)
+
+# Delay before buffered response log writes are flushed to disk
+_RESPONSE_FLUSH_INTERVAL = 0.5
+
+# Responses kept for identical requests when the response cache is enabled
+_RESPONSE_CACHE_SIZE = 512
+
+
+def _supports_prompt_caching(model_entry: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a /models entry advertises prompt caching.
+
+    Servers report capabilities either as a list of names or as a mapping
+    of capability flags.
+
+    Args:
+        model_entry: Entry for the configured model from the /models response
+
+    Returns:
+        bool: True if the model lists a prompt caching capability
+    """
+    if not model_entry:
+        return False
+    capabilities = model_entry.get("capabilities")
+    if isinstance(capabilities, dict):
+        return bool(capabilities.get("prompt_caching"))
+    if isinstance(capabilities, list):
+        return "prompt_caching" in capabilities
+    return False
+
+
+def _with_cache_control(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a message with an ephemeral cache_control marker on its last text block.
+
+    Args:
+        message: Chat message with string or content-block content
+
+    Returns:
+        Dict[str, Any]: New message in content-block form with the marker
+    """
+    content = message.get("content")
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content:
+        blocks = list(content)
+    else:
+        return message
+    blocks[-1] = dict(blocks[-1], cache_control={"type": "ephemeral"})
+    return dict(message, content=blocks)
 
 
 class MLXWToLLM:
     """Handles sending transcribed text to LLM using direct API calls."""
 
-    def __init__(self):
-        """Initialize the LLM handler."""
+    # API base URLs whose connection was validated by an earlier instance
+    _validated_urls: Set[str] = set()
+    # API base URLs whose configured model advertises prompt caching
+    _prompt_caching_urls: Set[str] = set()
+
+    def __init__(
+        self,
+        enable_cache: bool = LLM_RESPONSE_CACHE,
+        cache_sampled: bool = False,
+        validate: bool = True,
+        enable_semantic_cache: bool = LLM_SEMANTIC_CACHE,
+        semantic_threshold: float = LLM_SEMANTIC_CACHE_THRESHOLD,
+        history_reducer: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]] = reduce_history,
+    ):
+        """
+        Initialize the LLM handler.
+
+        Args:
+            enable_cache: Whether to reuse responses to identical requests
+            cache_sampled: Whether to also cache when the temperature is
+                above 0, where repeated requests would otherwise differ
+            validate: Whether to check the API connection and model on init
+            enable_semantic_cache: Whether to reuse responses to similar
+                single-turn prompts without document context
+            semantic_threshold: Minimum cosine similarity for a semantic cache hit
+            history_reducer: Bounds the chat history sent with each request
+        """
+        self.history_reducer = history_reducer
+        self._cache_enabled = enable_cache and (LLM_TEMPERATURE == 0 or cache_sampled)
+        self._response_cache: "OrderedDict[bytes, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._response_cache_lock = Lock()
+        self._doc_executor: Optional[ThreadPoolExecutor] = None
+        # Pending prefetches with the file stat they were started for
+        self._doc_prefetch: Dict[str, Tuple[Optional[Tuple[str, int, int]], Future]] = {}
+        self._doc_lock = Lock()
+        self._doc_cache: "OrderedDict[Tuple[str, int, int], Tuple[Optional[Union[str, Dict]], bool]]" = OrderedDict()
+        self._chat_executor: Optional[ThreadPoolExecutor] = None
+        self._semantic_cache: Optional[SemanticCache] = None
+        if enable_semantic_cache:
+            if semantic_cache_available():
+                self._semantic_cache = SemanticCache(
+                    LLM_SEMANTIC_CACHE_DIR, LLM_SEMANTIC_CACHE_MODEL, semantic_threshold
+                )
+                atexit.register(self._semantic_cache.save)
+            else:
+                logging.warning(
+                    "Semantic cache requires sentence-transformers and hnswlib; "
+                    "install with: uv sync --extra semantic"
+                )
+        # Request fields that never change, serialized once per stream mode
+        static_fields = (
+            b'{"model":' + json_dumps(LLM_MODEL)
+            + b',"temperature":' + json_dumps(LLM_TEMPERATURE)
+            + b',"max_tokens":' + json_dumps(LLM_MAX_TOKENS)
+        )
+        self._payload_prefixes = {
+            stream: static_fields + b',"stream":' + json_dumps(stream) + b',"messages":'
+            for stream in (False, True)
+        }
+        # Response log stays open in append mode, opened on first response;
+        # writes are flushed together shortly after a burst of responses
+        self._output_file: Optional[TextIO] = None
+        self._output_lock = Lock()
+        self._flush_timer: Optional[Timer] = None
+        atexit.register(self._close_output)
+        # Keep-alive session so each request reuses a pooled connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=_HTTP_POOL_MAXSIZE,
+            max_retries=_HTTP_RETRY,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._ensure_output_directory()
-        self._validate_llm_connection()
+        if validate:
+            self._validate_llm_connection()
+        # Mark stable prompt blocks for caching when configured or advertised
+        self.cache_control = (
+            LLM_PROMPT_CACHE_CONTROL or LLM_BASE_URL in MLXWToLLM._prompt_caching_urls
+        )
+
+    def __enter__(self) -> "MLXWToLLM":
+        """Use the handler as a context manager that closes its session."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the HTTP session on leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session, its pooled connections and the response log."""
+        with self._doc_lock:
+            executor, self._chat_executor = self._chat_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._session.close()
+        if self._semantic_cache is not None:
+            self._semantic_cache.save()
+        self._close_output()
+
+    def _close_output(self) -> None:
+        """Flush and close the response log."""
+        with self._output_lock:
+            output_file, self._output_file = self._output_file, None
+            flush_timer, self._flush_timer = self._flush_timer, None
+        if flush_timer is not None:
+            flush_timer.cancel()
+        if output_file is not None:
+            output_file.close()
+
+    def _flush_output(self) -> None:
+        """Flush buffered response log writes (runs on the flush timer)."""
+        try:
+            with self._output_lock:
+                self._flush_timer = None
+                if self._output_file is not None:
+                    self._output_file.flush()
+        except Exception as e:
+            logging.error(f"Failed to flush response log: {LLM_OUTPUT_FILENAME} - {e}")
 
     def _ensure_output_directory(self) -> None:
         """Ensure the output directory exists."""
+        if directories_ready():
+            return
         if not ensure_directory(OUTPUT_DIR):
             raise RuntimeError(
                 f"Failed to create/verify output directory: {OUTPUT_DIR}"
@@ -41,24 +271,37 @@ class MLXWToLLM:
         logging.debug(f"LLM output file will be: {LLM_OUTPUT_FILENAME}")
 
     def _validate_llm_connection(self) -> None:
-        """Validate LLM API connection and compatibility."""
+        """
+        Validate LLM API connection and compatibility.
+
+        Runs once per API base URL per process; later instances skip the probe.
+        """
+        if LLM_BASE_URL in MLXWToLLM._validated_urls:
+            return
+
         try:
             # Test connection with a simple request
-            response = requests.get(f"{LLM_BASE_URL}/models", timeout=LLM_REQUEST_TIMEOUT)
+            response = self._session.get(_MODELS_URL, timeout=LLM_REQUEST_TIMEOUT)
             response.raise_for_status()
 
             # Check if model is available
-            models = response.json()
-            available_models = [model.get("id", "") for model in models.get("data", [])]
+            models = json_loads(response.content)
+            model_entries = {model.get("id", ""): model for model in models.get("data", [])}
+            available_models = set(model_entries)
 
             if LLM_MODEL not in available_models:
                 logging.warning(
-                    f"Configured model '{LLM_MODEL}' not found in available models: {available_models}"
+                    f"Configured model '{LLM_MODEL}' not found in available models: {sorted(available_models)}"
                 )
                 logging.warning("Available models:")
-                for model in available_models:
+                for model in sorted(available_models):
                     logging.warning(f"  - {model}")
 
+            if _supports_prompt_caching(model_entries.get(LLM_MODEL)):
+                MLXWToLLM._prompt_caching_urls.add(LLM_BASE_URL)
+                logging.info("LLM server advertises prompt caching for this model")
+
+            MLXWToLLM._validated_urls.add(LLM_BASE_URL)
             logging.info(f"LLM API connection validated. Using model: {LLM_MODEL}")
 
         except requests.exceptions.RequestException as e:
@@ -68,6 +311,96 @@ class MLXWToLLM:
             logging.error(f"Unexpected error during LLM validation: {e}")
             logging.warning("Continuing without validation, but API calls may fail")
 
+    def prefetch_document(self, doc_path: str) -> None:
+        """
+        Start processing a document in the background.
+
+        Lets document reading and PDF/image conversion overlap with audio
+        recording so the result is ready when the chat request is built.
+
+        Args:
+            doc_path: Path to document for analysis
+        """
+        key = str(doc_path)
+        cache_key = self._doc_cache_key(key)
+        with self._doc_lock:
+            if key in self._doc_prefetch or cache_key in self._doc_cache:
+                return
+            if self._doc_executor is None:
+                self._doc_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="doc-prefetch"
+                )
+            self._doc_prefetch[key] = (
+                cache_key, self._doc_executor.submit(process_file, key)
+            )
+        logging.debug(f"Prefetching document context: {key}")
+
+    @staticmethod
+    def _doc_cache_key(doc_path: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Build the processed document cache key from the file's stat.
+
+        Args:
+            doc_path: Path to document for analysis
+
+        Returns:
+            Optional[Tuple[str, int, int]]: Path, mtime and size, or None if
+                the file cannot be stat'ed
+        """
+        try:
+            stat = os.stat(doc_path)
+        except OSError:
+            return None
+        return doc_path, stat.st_mtime_ns, stat.st_size
+
+    def _load_document(
+        self, doc_path: str
+    ) -> Tuple[Optional[Union[str, Dict]], bool]:
+        """
+        Get processed document content, using a pending prefetch if available.
+
+        Content is reused across chat turns until the file changes.
+
+        Args:
+            doc_path: Path to document for analysis
+
+        Returns:
+            Tuple[Optional[Union[str, Dict]], bool]: Processed content and image flag
+        """
+        key = str(doc_path)
+        cache_key = self._doc_cache_key(key)
+        with self._doc_lock:
+            cached = self._doc_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                self._doc_cache.move_to_end(cache_key)
+            prefetch = self._doc_prefetch.pop(key, None)
+        if cached is not None:
+            return cached
+
+        result = None
+        future = None
+        if prefetch is not None:
+            prefetch_key, future = prefetch
+            if prefetch_key != cache_key:
+                # The file changed after the prefetch read it
+                logging.debug(f"Discarding stale document prefetch: {key}")
+                future.cancel()
+                future = None
+        if future is not None:
+            try:
+                result = future.result()
+            except Exception as e:
+                logging.error(f"Document prefetch failed, retrying: {e}")
+        if result is None:
+            result = process_file(key)
+
+        if cache_key and result[0]:
+            with self._doc_lock:
+                self._doc_cache[cache_key] = result
+                if len(self._doc_cache) > _DOC_CACHE_SIZE:
+                    self._doc_cache.popitem(last=False)
+        return result
+
     def _prepare_messages(
         self, 
         current_text: str, 
@@ -77,9 +410,14 @@ class MLXWToLLM:
         """
         Prepare messages array for LLM request, adding document context if provided.
 
+        The history is sent unchanged ahead of the new message, so each
+        turn extends the previous request and the server can reuse its
+        cached prefix.
+
         Args:
             current_text: Current message to process
-            message_history: List of previous messages
+            message_history: List of previous messages, system messages
+                first (as ChatHistory keeps them)
             doc_path: Optional path to document for analysis
 
         Returns:
@@ -89,50 +427,201 @@ class MLXWToLLM:
             logging.warning("Empty current text provided")
             return []
 
-        messages = []
+        message_history = self.history_reducer(message_history)
 
         # Process document if provided
+        doc_message = None
         if doc_path:
-            processed_content, is_image = process_file(doc_path)
+            processed_content, is_image = self._load_document(doc_path)
             if processed_content:
                 if is_image:
                     # For images, add as user message
                     doc_message = prepare_content_message(processed_content, is_image=True)
                 else:
-                    # For text/PDF, add as system message
-                    doc_message = {
-                        "role": "system",
-                        "content": (
-                            f"<<DOCUMENT CONTEXT>>\n{processed_content}\n<<END DOCUMENT CONTEXT>>\n\n"
-                            "Consider the above document context when responding to queries. "
-                            "You can reference specific parts when relevant."
-                        )
-                    }
-                messages.append(doc_message)
+                    # For text/PDF, add as system message with identical text
+                    # every turn so backends can reuse the cached prompt
+                    # prefix instead of prefilling the document again
+                    doc_text = "".join((_DOC_PREFIX, processed_content, _DOC_SUFFIX))
+                    doc_message = {"role": "system", "content": doc_text}
+                    if self.cache_control:
+                        doc_message = _with_cache_control(doc_message)
                 logging.info(f"Added document context from: {doc_path}")
 
-        # Extract and validate system messages from history
-        system_messages = [
-            msg for msg in message_history if msg.get("role") == "system"
-        ]
-
-        # Extract conversation messages (non-system)
-        conversation = [msg for msg in message_history if msg.get("role") != "system"]
+        # Only the leading system messages are scanned; every message needs
+        # a role for the API, so index it directly
+        system_count = 0
+        get_role = _get_role
+        for msg in message_history:
+            if get_role(msg) != "system":
+                break
+            system_count += 1
 
-        # Combine in correct order: system messages first, then conversation, then current message
-        messages.extend(system_messages)  # System messages always first
-        messages.extend(conversation)  # Previous conversation
+        # Combine in correct order: system messages first, then document
+        # context, then conversation, then current message. Prefix caching
+        # only matches a shared leading run of tokens, so the chat's fixed
+        # system prompt leads and still matches when the document changes.
+        messages: List[Dict[str, Any]] = list(message_history)
+        if self.cache_control and system_count:
+            # Breakpoint after the chat's system prompt, so its cached
+            # prefix survives a document change; history is left untouched
+            messages[system_count - 1] = _with_cache_control(messages[system_count - 1])
+        if doc_message:
+            messages.insert(system_count, doc_message)  # Document context
         messages.append({"role": "user", "content": current_text})  # Current message
 
-        # Log message structure
-        logging.debug(f"Prepared messages structure:")
-        logging.debug(f"- Document context: {'Yes' if doc_path else 'No'}")
-        logging.debug(f"- System messages: {len(system_messages)}")
-        logging.debug(f"- Conversation messages: {len(conversation)}")
-        logging.debug(f"- Total messages: {len(messages)}")
+        # Log message structure; skipped entirely unless debugging
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Prepared messages structure:")
+            logging.debug("- Document context: %s", "Yes" if doc_path else "No")
+            logging.debug("- System messages: %d", system_count)
+            logging.debug("- Conversation messages: %d", len(message_history) - system_count)
+            logging.debug("- Total messages: %d", len(messages))
 
         return messages
 
+    def _build_body(self, messages: List[Dict[str, Any]], stream: bool) -> bytes:
+        """
+        Serialize the chat completions request body.
+
+        Only the messages are encoded per request; the fixed model and
+        sampling fields come from a prefix serialized once at init.
+
+        Args:
+            messages: Prepared messages for LLM request
+            stream: Whether to request a server-sent event stream
+
+        Returns:
+            bytes: JSON request body
+        """
+        return self._payload_prefixes[stream] + json_dumps(messages) + b"}"
+
+    @staticmethod
+    def _api_error_message(response: requests.Response) -> str:
+        """
+        Describe a failed LLM API response, including the server's error text.
+
+        Args:
+            response: Non-200 response from the LLM API
+
+        Returns:
+            str: Error message for logging
+        """
+        error_msg = f"LLM API error: {response.status_code}"
+        try:
+            error_data = json_loads(response.content)
+            error_details = error_data.get("error", {})
+            if isinstance(error_details, dict):
+                error_msg = f"{error_msg} - {error_details.get('message', 'Unknown error')}"
+            else:
+                error_msg = f"{error_msg} - {error_details}"
+        except:
+            error_msg = f"{error_msg} - {response.text[:500]}"  # Limit error text length
+        return error_msg
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """
+        Get the wait before retrying a rate-limited or failed chat request.
+
+        Args:
+            response: Retryable response from the LLM API
+            attempt: Zero-based number of the attempt that failed
+
+        Returns:
+            float: Seconds to wait, from Retry-After or exponential backoff with jitter
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), _CHAT_RETRY_MAX_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        delay = min(_CHAT_RETRY_BACKOFF * 2 ** attempt, _CHAT_RETRY_MAX_DELAY)
+        return delay + random.uniform(0, _CHAT_RETRY_BACKOFF)
+
+    def _post_chat(self, body: bytes, stream: bool = False) -> requests.Response:
+        """
+        Send a chat completion request, retrying rate limits and server errors.
+
+        Args:
+            body: JSON request body from _build_body()
+            stream: Whether to stream the response body
+
+        Returns:
+            requests.Response: Final response, which may still be an error
+        """
+        for attempt in range(_CHAT_RETRIES + 1):
+            response = self._session.post(
+                _CHAT_URL,
+                headers=_JSON_HEADERS,
+                data=body,
+                timeout=LLM_REQUEST_TIMEOUT,
+                stream=stream,
+            )
+            if response.status_code not in _CHAT_RETRY_STATUSES or attempt == _CHAT_RETRIES:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            logging.warning(
+                f"LLM API returned {response.status_code}, retrying in {delay:.1f}s "
+                f"({attempt + 1}/{_CHAT_RETRIES})"
+            )
+            response.close()
+            time.sleep(delay)
+        return response
+
+    def _semantic_context(
+        self, messages: List[Dict[str, Any]], doc_path: Optional[str]
+    ) -> Optional[str]:
+        """
+        Get the semantic cache context key for a request, if it is eligible.
+
+        Only single-turn prompts without document context are eligible, since
+        a reply to a follow-up depends on the conversation before it.
+
+        Args:
+            messages: Prepared messages for LLM request
+            doc_path: Optional path to document for analysis
+
+        Returns:
+            Optional[str]: Digest of the request settings and system messages,
+                or None if the semantic cache does not apply
+        """
+        if self._semantic_cache is None or doc_path:
+            return None
+        prior = messages[:-1]
+        if any(_get_role(msg) != "system" for msg in prior):
+            return None
+        return hashlib.blake2b(
+            self._payload_prefixes[False] + json_dumps(prior), digest_size=16
+        ).hexdigest()
+
+    @staticmethod
+    def _cached_completion(response_text: str) -> Dict[str, Any]:
+        """
+        Build a completion object for a response served from the semantic cache.
+
+        The ID is fresh because new chats take their chat ID from it.
+
+        Args:
+            response_text: Cached response text
+
+        Returns:
+            Dict[str, Any]: Completion in the chat completions response format
+        """
+        return {
+            "id": f"chatcmpl-cache-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "model": LLM_MODEL,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": response_text},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+
     def process_chat(
         self, 
         text: str, 
@@ -162,49 +651,60 @@ class MLXWToLLM:
             if not messages:
                 return None, None
 
-            # Prepare request payload
-            payload = {
-                "model": LLM_MODEL,
-                "messages": messages,
-                "temperature": LLM_TEMPERATURE,
-                "max_tokens": LLM_MAX_TOKENS,
-                "stream": False,
-            }
-
-            headers = {"Content-Type": "application/json"}
-
             # Log request details for debugging
             logging.debug(
-                f"Making chat request to LLM API - URL: {LLM_BASE_URL}/chat/completions"
+                "Making chat request to LLM API - URL: %s", _CHAT_URL
             )
             if doc_path:
-                logging.debug(f"Including document context from: {doc_path}")
+                logging.debug("Including document context from: %s", doc_path)
 
-            # Make request to LLM API with configured timeout
-            response = requests.post(
-                f"{LLM_BASE_URL}/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=LLM_REQUEST_TIMEOUT
+            # The body is serialized up front (with orjson when installed)
+            # and its digest doubles as the response cache key
+            body = self._build_body(messages, stream=False)
+            cache_key = (
+                hashlib.blake2b(body, digest_size=16).digest()
+                if self._cache_enabled
+                else None
             )
+            if cache_key is not None:
+                with self._response_cache_lock:
+                    cached = self._response_cache.get(cache_key)
+                    if cached is not None:
+                        self._response_cache.move_to_end(cache_key)
+                if cached is not None:
+                    logging.debug("Using cached LLM response for identical request")
+                    response_text, result = cached
+                    self._save_response(response_text)
+                    # Fresh ID, since new chats take their chat ID from it
+                    return response_text, {
+                        **result, "id": f"chatcmpl-cache-{uuid.uuid4().hex}"
+                    }
+
+            # Similar single-turn prompts can reuse an earlier response
+            semantic_context = self._semantic_context(messages, doc_path)
+            embedding = None
+            if semantic_context is not None:
+                try:
+                    embedding = self._semantic_cache.embed(text)
+                    similar = self._semantic_cache.lookup(semantic_context, embedding)
+                except Exception as e:
+                    logging.error(f"Semantic cache lookup failed: {e}")
+                    similar = None
+                if similar is not None:
+                    logging.info("Using cached LLM response for similar prompt")
+                    self._save_response(similar)
+                    return similar, self._cached_completion(similar)
+
+            # Make request to LLM API with configured timeout
+            response = self._post_chat(body)
 
             # Better error handling with response content
             if response.status_code != 200:
-                error_msg = f"LLM API error: {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_details = error_data.get("error", {})
-                    if isinstance(error_details, dict):
-                        error_msg = f"{error_msg} - {error_details.get('message', 'Unknown error')}"
-                    else:
-                        error_msg = f"{error_msg} - {error_details}"
-                except:
-                    error_msg = f"{error_msg} - {response.text[:500]}"  # Limit error text length
-                logging.error(error_msg)
+                logging.error(self._api_error_message(response))
                 return None, None
 
             # Parse response
-            result = response.json()
+            result = json_loads(response.content)
 
             # Validate response structure
             if not isinstance(result, dict) or "choices" not in result:
@@ -220,6 +720,18 @@ class MLXWToLLM:
             # Save response to file
             self._save_response(response_text)
 
+            if cache_key is not None:
+                with self._response_cache_lock:
+                    self._response_cache[cache_key] = (response_text, result)
+                    if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+
+            if embedding is not None:
+                try:
+                    self._semantic_cache.store(semantic_context, embedding, response_text)
+                except Exception as e:
+                    logging.error(f"Error adding response to semantic cache: {e}")
+
             return response_text, result
 
         except requests.exceptions.Timeout:
@@ -228,10 +740,257 @@ class MLXWToLLM:
         except requests.exceptions.RequestException as e:
             logging.error(f"Error during chat API request: {e}")
             return None, None
-        except Exception as e:
-            logging.error(f"Error during chat processing: {e}")
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            # Malformed JSON or an unexpected response shape
+            logging.error(f"Invalid LLM API response: {e}")
             return None, None
 
+    def stream_chat(
+        self,
+        text: str,
+        message_history: List[Dict[str, str]],
+        doc_path: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chat response as text deltas while the LLM generates it.
+
+        Lets callers start on the first sentence (e.g. speech synthesis)
+        before the full completion arrives. The joined response is saved
+        to the output file once the stream ends.
+
+        Args:
+            text: Current message to process
+            message_history: List of previous messages in the conversation
+            doc_path: Optional path to document for analysis
+
+        Yields:
+            str: Response text deltas in arrival order
+        """
+        if not text:
+            logging.error("No text provided for chat processing")
+            return
+
+        chunks: List[str] = []
+        try:
+            messages = self._prepare_messages(text, message_history, doc_path)
+            if not messages:
+                return
+
+            body = self._build_body(messages, stream=True)
+            with self._post_chat(body, stream=True) as response:
+                if response.status_code != 200:
+                    logging.error(self._api_error_message(response))
+                    return
+
+                for line in response.iter_lines():
+                    # Server-sent events: "data: {...}" lines, ended by [DONE]
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == b"[DONE]":
+                        break
+
+                    choices = json_loads(data).get("choices")
+                    if not choices:
+                        continue
+                    content = (choices[0].get("delta") or {}).get("content")
+                    if content:
+                        chunks.append(content)
+                        yield content
+
+        except requests.exceptions.Timeout:
+            logging.error(f"LLM API request timed out after {LLM_REQUEST_TIMEOUT} seconds")
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Error during chat API request: {e}")
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            # Malformed event JSON or an unexpected event shape
+            logging.error(f"Invalid LLM API stream event: {e}")
+        finally:
+            if chunks:
+                self._save_response("".join(chunks))
+
+    def submit_chat(
+        self,
+        text: str,
+        message_history: List[Dict[str, str]],
+        doc_path: Optional[str] = None
+    ) -> Future:
+        """
+        Process a chat message in the background.
+
+        Independent chats submitted together run concurrently over the
+        pooled session, so their network waits overlap.
+
+        Args:
+            text: Current message to process
+            message_history: List of previous messages in the conversation
+            doc_path: Optional path to document for analysis
+
+        Returns:
+            Future: Resolves to the process_chat() result tuple
+        """
+        return self._get_chat_executor().submit(
+            self.process_chat, text, message_history, doc_path
+        )
+
+    def _get_chat_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the pool that runs background chat requests, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: Pool bounded by LLM_MAX_CONCURRENCY
+        """
+        with self._doc_lock:
+            if self._chat_executor is None:
+                self._chat_executor = ThreadPoolExecutor(
+                    max_workers=LLM_MAX_CONCURRENCY, thread_name_prefix="llm-chat"
+                )
+            return self._chat_executor
+
+    async def aprocess_chat(
+        self,
+        text: str,
+        message_history: List[Dict[str, str]],
+        doc_path: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Process a chat message without blocking the running event loop.
+
+        The request runs on the submit_chat() pool over the pooled session,
+        so coroutines can gather several chats concurrently.
+
+        Args:
+            text: Current message to process
+            message_history: List of previous messages in the conversation
+            doc_path: Optional path to document for analysis
+
+        Returns:
+            Tuple[Optional[str], Optional[Dict[str, Any]]]: Same as process_chat()
+        """
+        return await asyncio.wrap_future(
+            self.submit_chat(text, message_history, doc_path)
+        )
+
+    async def astream_chat(
+        self,
+        text: str,
+        message_history: List[Dict[str, str]],
+        doc_path: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat response into the running event loop as it is generated.
+
+        stream_chat() runs on the chat pool and hands each delta to the loop,
+        so the first tokens reach the caller while the LLM is still generating.
+        Leaving the iteration early stops reading the stream.
+
+        Args:
+            text: Current message to process
+            message_history: List of previous messages in the conversation
+            doc_path: Optional path to document for analysis
+
+        Yields:
+            str: Response text deltas in arrival order
+        """
+        loop = asyncio.get_running_loop()
+        chunks: "asyncio.Queue[Any]" = asyncio.Queue()
+        stop = Event()
+
+        def produce() -> None:
+            try:
+                for chunk in self.stream_chat(text, message_history, doc_path):
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+            finally:
+                if not stop.is_set():
+                    loop.call_soon_threadsafe(chunks.put_nowait, _STREAM_END)
+
+        future = self._get_chat_executor().submit(produce)
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is _STREAM_END:
+                    break
+                yield chunk
+            await asyncio.wrap_future(future)
+        finally:
+            stop.set()
+
+    def process_chat_batch(
+        self,
+        texts: List[str],
+        message_histories: List[List[Dict[str, str]]],
+    ) -> List[Tuple[Optional[str], Optional[Dict[str, Any]]]]:
+        """
+        Process independent chat turns concurrently.
+
+        Turns run through submit_chat(), so at most LLM_MAX_CONCURRENCY
+        requests reach the LLM server at once.
+
+        Args:
+            texts: Current message of each chat
+            message_histories: Message history of each chat, paired with texts
+
+        Returns:
+            List[Tuple[Optional[str], Optional[Dict[str, Any]]]]:
+                process_chat() result per chat, in input order
+        """
+        if len(texts) != len(message_histories):
+            raise ValueError("texts and message_histories must have the same length")
+
+        futures = [
+            self.submit_chat(text, history)
+            for text, history in zip(texts, message_histories)
+        ]
+        return [future.result() for future in futures]
+
+    def process_many(self, texts: List[str], retries: int = 2) -> List[Optional[str]]:
+        """
+        Send independent prompts to the LLM concurrently.
+
+        Prompts run through submit_chat(), so at most LLM_MAX_CONCURRENCY requests
+        are in flight. Prompts that fail are retried with exponential backoff.
+
+        Args:
+            texts: Prompts to send, each as a new single-message chat
+            retries: Extra attempts for prompts that fail
+
+        Returns:
+            List[Optional[str]]: Response text per prompt, in input order,
+                None where a prompt failed
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        pending = [i for i, text in enumerate(texts) if text]
+
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = _BATCH_RETRY_BACKOFF * 2 ** (attempt - 1)
+                logging.warning(
+                    f"Retrying {len(pending)} failed LLM prompt(s) in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+            futures = [(i, self.submit_chat(texts[i], [])) for i in pending]
+            pending = []
+            for i, future in futures:
+                # One prompt failing unexpectedly does not abort the batch
+                try:
+                    response_text, _ = future.result()
+                except Exception as e:
+                    logging.error(f"Unexpected error processing LLM prompt: {e}")
+                    response_text = None
+                if response_text is None:
+                    pending.append(i)
+                else:
+                    results[i] = response_text
+            if not pending:
+                break
+
+        if pending:
+            logging.error(f"{len(pending)} of {len(texts)} LLM prompt(s) failed")
+        return results
+
     def _save_response(self, response_text: str) -> None:
         """
         Save LLM response to output file.
@@ -240,10 +999,20 @@ class MLXWToLLM:
             response_text: Response text to save
         """
         content = f"\nResponse: {response_text}\n{'-' * 50}\n"
-        if safe_write_file(content, LLM_OUTPUT_FILENAME, append=True):
+        try:
+            with self._output_lock:
+                if self._output_file is None:
+                    self._output_file = open(
+                        LLM_OUTPUT_FILENAME, "a", encoding="utf-8", buffering=1 << 16
+                    )
+                self._output_file.write(content)
+                if self._flush_timer is None:
+                    self._flush_timer = Timer(_RESPONSE_FLUSH_INTERVAL, self._flush_output)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
             logging.info(f"Response saved to: {LLM_OUTPUT_FILENAME}")
-        else:
-            logging.error(f"Failed to save response to: {LLM_OUTPUT_FILENAME}")
+        except Exception as e:
+            logging.error(f"Failed to save response to: {LLM_OUTPUT_FILENAME} - {e}")
 
     def process_text(self, text: str) -> Optional[str]:
         """
@@ -259,11 +1028,34 @@ class MLXWToLLM:
             logging.error("No text provided for LLM processing")
             return None
 
-        try:
-            # Process as a single message chat
-            response_text, _ = self.process_chat(text, [], doc_path=None)
-            return response_text
+        # Process as a single message chat
+        response_text, _ = self.process_chat(text, [], doc_path=None)
+        return response_text
 
-        except Exception as e:
-            logging.error(f"Error during LLM processing: {e}")
-            return None
\ No newline at end of file
+    async def aprocess_text(self, text: str) -> Optional[str]:
+        """
+        Send text to LLM without blocking the running event loop.
+
+        Args:
+            text: Text to send to LLM
+
+        Returns:
+            Optional[str]: Processed LLM response if successful, None otherwise
+        """
+        if not text:
+            logging.error("No text provided for LLM processing")
+            return None
+
+        response_text, _ = await self.aprocess_chat(text, [])
+        return response_text
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_handler() -> MLXWToLLM:
+    """
+    Get the process-wide LLM handler, creating it on first use.
+
+    Returns:
+        MLXWToLLM: Shared LLM handler instance
+    """
+    return MLXWToLLM()
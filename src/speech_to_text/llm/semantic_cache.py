@@ -0,0 +1,201 @@
+# File: src/speech_to_text/llm/semantic_cache.py
+"""
+Semantic response cache for LLM prompts.
+Reuses a past response when a new prompt embeds close to an earlier one.
+Requires the optional sentence-transformers and hnswlib packages.
+"""
+
+import logging
+import os
+from threading import Lock
+from typing import Any, List, Optional, Tuple
+
+try:
+    import hnswlib
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    hnswlib = None
+    SentenceTransformer = None
+
+from speech_to_text.utils.json_utils import JSONDecodeError, json_dumps, json_loads
+
+# Index capacity added whenever the index fills up
+_INDEX_GROWTH = 1024
+
+# Neighbors checked per lookup, so a close prompt from another context
+# (e.g. a different system prompt) does not hide a usable match
+_LOOKUP_NEIGHBORS = 4
+
+
+def semantic_cache_available() -> bool:
+    """
+    Check whether the optional semantic cache dependencies are installed.
+
+    Returns:
+        bool: True if sentence-transformers and hnswlib can be used
+    """
+    return hnswlib is not None and SentenceTransformer is not None
+
+
+class SemanticCache:
+    """Nearest-neighbor cache of LLM responses keyed by prompt embeddings."""
+
+    def __init__(self, cache_dir: str, model_name: str, threshold: float):
+        """
+        Initialize the cache. The embedding model and index load on first use.
+
+        Args:
+            cache_dir: Directory the index and its responses are persisted to
+            model_name: sentence-transformers model used to embed prompts
+            threshold: Minimum cosine similarity for a cached response to be reused
+        """
+        self._cache_dir = cache_dir
+        self._index_path = os.path.join(cache_dir, "index.bin")
+        self._entries_path = os.path.join(cache_dir, "entries.jsonl")
+        self._model_name = model_name
+        self._threshold = threshold
+        self._model: Optional[Any] = None
+        self._index: Optional[Any] = None
+        # (context key, response) per index label
+        self._entries: List[Tuple[str, str]] = []
+        self._dirty = False
+        self._lock = Lock()
+
+    def _ensure_loaded(self) -> None:
+        """Load the embedding model and restore any persisted index."""
+        with self._lock:
+            if self._index is not None:
+                return
+
+            os.makedirs(self._cache_dir, exist_ok=True)
+            model = SentenceTransformer(self._model_name)
+            index = hnswlib.Index(
+                space="cosine", dim=model.get_sentence_embedding_dimension()
+            )
+
+            stored = self._read_entries()
+            if stored and os.path.exists(self._index_path):
+                index.load_index(
+                    self._index_path, max_elements=len(stored) + _INDEX_GROWTH
+                )
+                # Responses appended after the last index save have no vector
+                entries = stored[: index.get_current_count()]
+                logging.info(f"Loaded semantic cache with {len(entries)} responses")
+            else:
+                index.init_index(max_elements=_INDEX_GROWTH, ef_construction=200, M=16)
+                entries = []
+            index.set_ef(50)
+            if len(entries) != len(stored):
+                # Keep file lines aligned with index labels for later appends
+                self._write_entries(entries)
+
+            self._model = model
+            self._entries = entries
+            self._index = index
+
+    def _read_entries(self) -> List[Tuple[str, str]]:
+        """
+        Read persisted responses in index label order.
+
+        Returns:
+            List[Tuple[str, str]]: (context key, response) pairs
+        """
+        entries = []
+        try:
+            with open(self._entries_path, "rb") as f:
+                for line in f:
+                    context_key, response_text = json_loads(line)
+                    entries.append((context_key, response_text))
+        except FileNotFoundError:
+            pass
+        except (JSONDecodeError, ValueError) as e:
+            logging.error(f"Discarding unreadable semantic cache entries: {e}")
+            return []
+        return entries
+
+    def _write_entries(self, entries: List[Tuple[str, str]]) -> None:
+        """
+        Replace the persisted responses.
+
+        Args:
+            entries: (context key, response) pairs in index label order
+        """
+        try:
+            with open(self._entries_path, "wb") as f:
+                f.writelines(json_dumps(list(entry)) + b"\n" for entry in entries)
+        except OSError as e:
+            logging.error(f"Error rewriting semantic cache entries: {e}")
+
+    def embed(self, text: str) -> Any:
+        """
+        Embed a prompt for lookup and storage.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            Any: Normalized embedding row
+        """
+        self._ensure_loaded()
+        return self._model.encode([text], normalize_embeddings=True)
+
+    def lookup(self, context_key: str, embedding: Any) -> Optional[str]:
+        """
+        Find a cached response for a similar prompt in the same context.
+
+        Args:
+            context_key: Digest of everything sent ahead of the prompt
+            embedding: Prompt embedding from embed()
+
+        Returns:
+            Optional[str]: Cached response if one is similar enough, None otherwise
+        """
+        with self._lock:
+            count = self._index.get_current_count()
+            if not count:
+                return None
+            labels, distances = self._index.knn_query(
+                embedding, k=min(_LOOKUP_NEIGHBORS, count)
+            )
+
+            for label, distance in zip(labels[0], distances[0]):
+                if 1.0 - distance < self._threshold:
+                    break
+                entry_context, response_text = self._entries[label]
+                if entry_context == context_key:
+                    logging.debug(f"Semantic cache hit (similarity {1.0 - distance:.3f})")
+                    return response_text
+        return None
+
+    def store(self, context_key: str, embedding: Any, response_text: str) -> None:
+        """
+        Add a response to the cache.
+
+        Args:
+            context_key: Digest of everything sent ahead of the prompt
+            embedding: Prompt embedding from embed()
+            response_text: LLM response to reuse for similar prompts
+        """
+        with self._lock:
+            label = len(self._entries)
+            if label >= self._index.get_max_elements():
+                self._index.resize_index(label + _INDEX_GROWTH)
+            self._index.add_items(embedding, [label])
+            self._entries.append((context_key, response_text))
+            self._dirty = True
+            try:
+                with open(self._entries_path, "ab") as f:
+                    f.write(json_dumps([context_key, response_text]) + b"\n")
+            except OSError as e:
+                logging.error(f"Error persisting semantic cache entry: {e}")
+
+    def save(self) -> None:
+        """Write the index to disk if responses were added since the last save."""
+        with self._lock:
+            if self._index is None or not self._dirty:
+                return
+            try:
+                self._index.save_index(self._index_path)
+                self._dirty = False
+            except Exception as e:
+                logging.error(f"Error saving semantic cache index: {e}")
@@ -6,28 +6,85 @@ Handles transcription of audio data using the MLX Whisper model.
 
 import logging
 import mlx.core as mx
+from threading import Lock, Thread
 from typing import Optional, Dict, Any, Tuple
 from mlx_whisper.transcribe import transcribe
+
+try:
+    # Process-wide holder transcribe() loads the model through
+    from mlx_whisper.transcribe import ModelHolder
+except ImportError:
+    ModelHolder = None
 from speech_to_text.config.settings import (
+    EXIT_COMMANDS,
+    EXIT_COMMAND_MAX_LENGTH,
     MODEL_NAME,
     VERBOSE,
     WORD_TIMESTAMPS,
     MINIMUM_WORD_COUNT,
-    SUSPICIOUS_RESPONSES,
+    SUSPICIOUS_RESPONSES_NORMALIZED,
 )
 
+# One background load per model for the whole process; the API builds a
+# transcriber per request and ModelHolder itself does not lock
+_preload_threads: Dict[str, Thread] = {}
+_preload_lock = Lock()
+
+
+def _preload_model(model_name: str) -> None:
+    """
+    Load the Whisper weights into the holder transcribe() reads from.
+
+    Uses float16, the dtype transcribe() requests by default, so the first
+    transcription finds the model already loaded.
+
+    Args:
+        model_name: Name or path of the Whisper model to load
+    """
+    try:
+        ModelHolder.get_model(model_name, mx.float16)
+        logging.debug(f"Whisper model ready: {model_name}")
+    except Exception as e:
+        logging.warning(f"Could not preload Whisper model, loading on first use: {e}")
+
+
+def _start_preload(model_name: str) -> Thread:
+    """
+    Start the background load of a Whisper model, once per process.
+
+    Args:
+        model_name: Name or path of the Whisper model to load
+
+    Returns:
+        Thread: Shared thread loading the model, possibly already finished
+    """
+    with _preload_lock:
+        thread = _preload_threads.get(model_name)
+        if thread is None:
+            thread = Thread(
+                target=_preload_model, args=(model_name,), name="whisper-preload", daemon=True
+            )
+            thread.start()
+            _preload_threads[model_name] = thread
+        return thread
+
 
 class WhisperTranscriber:
     """Handles transcription of audio using the MLX Whisper model."""
 
-    def __init__(self, model_name: str = MODEL_NAME):
+    def __init__(self, model_name: str = MODEL_NAME, preload: bool = True):
         """
         Initialize the WhisperTranscriber.
 
         Args:
             model_name: Name or path of the Whisper model to use
+            preload: Whether to load the model in the background now, so
+                loading overlaps with recording instead of the first transcription
         """
         self.model_name = model_name
+        self._preload: Optional[Thread] = None
+        if preload and ModelHolder is not None:
+            self._preload = _start_preload(model_name)
         logging.info(f"Initialized WhisperTranscriber with model: {model_name}")
 
     def transcribe_audio(
@@ -46,13 +103,19 @@ class WhisperTranscriber:
             Optional[Dict[str, Any]]: Dictionary containing transcription results or None if failed
         """
 
-        if audio_data is None or len(audio_data) == 0:
+        if audio_data is None or audio_data.size == 0:
             logging.error("No audio data provided for transcription")
             return None
 
+        # Let the shared background model load finish instead of loading it twice
+        if self._preload is not None:
+            self._preload.join()
+
         try:
-            # Ensure audio_data is in float32 format (MLX-Whisper expects normalized input)
-            audio_data = audio_data.astype(mx.float32)
+            # Ensure audio_data is in float32 format (MLX-Whisper expects normalized input);
+            # the recorder already produces float32, so skip the buffer copy then
+            if audio_data.dtype != mx.float32:
+                audio_data = audio_data.astype(mx.float32)
 
             logging.info("Starting transcription...")
             # Perform transcription using MLX Whisper
@@ -119,7 +182,7 @@ class WhisperTranscriber:
             )
 
         # Check for suspicious responses
-        if normalized_text in [self._normalize_text(r) for r in SUSPICIOUS_RESPONSES]:
+        if normalized_text in SUSPICIOUS_RESPONSES_NORMALIZED:
             return False, "Low confidence transcription detected"
 
         return True, None
@@ -134,11 +197,14 @@ class WhisperTranscriber:
         Returns:
             bool: True if exit command detected, False otherwise
         """
-        if not transcription or "text" not in transcription:
+        if not transcription:
             return False
 
-        text = transcription["text"].strip().lower()
-        return text == "exit"
+        text = transcription.get("text")
+        if not text or len(text) > EXIT_COMMAND_MAX_LENGTH:
+            return False
+        # transcribe_audio() normalizes by default, so try the text as-is first
+        return text in EXIT_COMMANDS or text.strip().lower() in EXIT_COMMANDS
 
     def get_transcribed_text(self, transcription: Dict[str, Any]) -> Optional[str]:
         """
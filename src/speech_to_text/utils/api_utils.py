@@ -4,15 +4,20 @@ API utility functions for handling SSE events and response formatting.
 Provides shared functionality across API routes with enhanced document context support.
 """
 
-import json
 import logging
 from typing import Optional, Dict, Any
-from queue import Queue
+from queue import Empty, Full, Queue
 from pathlib import Path
 
+from speech_to_text.utils.json_utils import json_dumps
+
 # Store session queues globally
 session_queues: Dict[str, Queue] = {}
 
+# Events buffered per session; when a client falls behind, the oldest
+# queued events (superseded progress updates) are dropped
+STATUS_QUEUE_SIZE = 256
+
 # Enhanced error types
 ERROR_TYPES = {
     "invalid_parameter": "Invalid request parameters",
@@ -23,19 +28,22 @@ ERROR_TYPES = {
     "validation_error": "Input validation errors"
 }
 
-# Status types with descriptions
-STATUS_TYPES = {
-    "calibrating": "Initial microphone calibration",
-    "recording": "Active recording",
-    "silence": "Silence detection (includes progress 0-100)",
-    "processing": "Processing audio",
-    "doc_loading": "Loading document context",
-    "doc_processing": "Processing with document context",
-    "streaming": "Playing voice response",
-    "complete": "Operation complete",
-    "error": "Error occurred"
+# SSE event type for each status, resolved with a single lookup per event
+_STATUS_TO_EVENT = {
+    "calibrating": "calibration",  # Initial microphone calibration
+    "recording": "recording",  # Active recording
+    "silence": "recording",  # Silence detection (includes progress 0-100)
+    "processing": "recording",  # Processing audio
+    "doc_loading": "processing",  # Loading document context
+    "doc_processing": "processing",  # Processing with document context
+    "streaming": "streaming",  # Playing voice response
+    "complete": "complete",  # Operation complete
+    "error": "error",  # Error occurred
 }
 
+# Statuses that end a session's event stream
+TERMINAL_STATUSES = frozenset({"complete", "error"})
+
 def format_sse(
     data: dict, event: Optional[str] = None, retry: Optional[int] = None
 ) -> str:
@@ -50,12 +58,13 @@ def format_sse(
     Returns:
         str: Formatted SSE message
     """
-    msg = f"data: {json.dumps(data)}\n"
-    if event is not None:
-        msg = f"event: {event}\n{msg}"
-    if retry is not None:
-        msg = f"retry: {retry}\n{msg}"
-    return f"{msg}\n"
+    # Serialized with orjson when installed; compact JSON has no newlines
+    body = json_dumps(data).decode("utf-8")
+    if event is None and retry is None:
+        return f"data: {body}\n\n"
+    retry_line = f"retry: {retry}\n" if retry is not None else ""
+    event_line = f"event: {event}\n" if event is not None else ""
+    return f"{retry_line}{event_line}data: {body}\n\n"
 
 
 def create_status_response(
@@ -94,49 +103,6 @@ def create_status_response(
     return response
 
 
-def get_event_type(status: str) -> str:
-    """
-    Get the appropriate event type for a status.
-    
-    Args:
-        status: Status identifier
-
-    Returns:
-        str: Event type for SSE
-    """
-    # Document-specific events
-    if status in ["doc_loading", "doc_processing"]:
-        return "processing"
-    
-    # Standard events
-    if status == "calibrating":
-        return "calibration"
-    elif status in ["recording", "silence", "processing"]:
-        return "recording"
-    elif status in ["streaming", "complete", "error"]:
-        return status
-    
-    # Default event type
-    logging.warning(f"Unknown status type: {status}")
-    return "recording"
-
-
-def validate_status_type(status: str) -> bool:
-    """
-    Validate a status type against known types.
-
-    Args:
-        status: Status type to validate
-
-    Returns:
-        bool: True if valid status type
-    """
-    if status not in STATUS_TYPES:
-        logging.warning(f"Unknown status type: {status}")
-        return False
-    return True
-
-
 def create_document_error(
     error_message: str,
     doc_path: Optional[str] = None
@@ -162,6 +128,35 @@ def create_document_error(
     return error
 
 
+def create_status_queue() -> Queue:
+    """
+    Create the bounded event queue for a new session.
+
+    Returns:
+        Queue: Status event queue holding at most STATUS_QUEUE_SIZE events
+    """
+    return Queue(maxsize=STATUS_QUEUE_SIZE)
+
+
+def _put_dropping_oldest(status_queue: Queue, event: Dict[str, Any]) -> None:
+    """
+    Queue an event without blocking, dropping the oldest events if full.
+
+    Args:
+        status_queue: Session status queue
+        event: Event to queue
+    """
+    while True:
+        try:
+            status_queue.put_nowait(event)
+            return
+        except Full:
+            try:
+                status_queue.get_nowait()
+            except Empty:
+                pass
+
+
 def create_status_callback(session_id: str, status_queue: Queue) -> callable:
     """
     Create a status callback function for the given session.
@@ -190,10 +185,12 @@ def create_status_callback(session_id: str, status_queue: Queue) -> callable:
             doc_path: Optional document path for context
         """
         try:
-            # Validate status type
-            if not validate_status_type(status):
-                status = "error"
+            # Validate status type and resolve its event type in one lookup
+            event_type = _STATUS_TO_EVENT.get(status)
+            if event_type is None:
+                logging.warning(f"Unknown status type: {status}")
                 message = f"Invalid status type: {status}"
+                status = event_type = "error"
 
             # Create status data
             status_data = {
@@ -207,9 +204,9 @@ def create_status_callback(session_id: str, status_queue: Queue) -> callable:
             if doc_path:
                 status_data["doc_path"] = str(doc_path)
 
-            # Get event type and queue update
-            event_type = get_event_type(status)
-            status_queue.put(
+            # Queue update
+            _put_dropping_oldest(
+                status_queue,
                 {
                     "event": event_type,
                     "data": status_data
@@ -226,7 +223,7 @@ def create_status_callback(session_id: str, status_queue: Queue) -> callable:
             logging.error(error_msg)
             # Try to queue error status
             try:
-                status_queue.put({
+                _put_dropping_oldest(status_queue, {
                     "event": "error",
                     "data": {
                         "session_id": session_id,
@@ -0,0 +1,49 @@
+# File: src/speech_to_text/utils/json_utils.py
+"""
+JSON encoding utilities for the speech-to-text application.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: Encoded JSON without insignificant whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON from bytes or a string.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Any: Decoded object
+
+    Raises:
+        JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
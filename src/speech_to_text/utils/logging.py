@@ -5,7 +5,7 @@ Sets up logging with consistent formatting across the application.
 """
 
 import logging
-from speech_to_text.config.settings import LOG_FORMAT, LOG_LEVEL
+from speech_to_text.config.settings import DEFERRED_WARNINGS, LOG_FORMAT, LOG_LEVEL
 
 
 def setup_logging() -> None:
@@ -30,3 +30,11 @@ def setup_logging() -> None:
 
         # Add handler to logger
         logger.addHandler(console_handler)
+
+        # Module loggers already print through this handler, not the root one
+        logger.propagate = False
+
+    # Report configuration problems found before logging was available
+    for message in DEFERRED_WARNINGS:
+        logger.warning(message)
+    DEFERRED_WARNINGS.clear()
@@ -4,11 +4,44 @@ Path handling utilities for the speech-to-text application.
 Provides consistent path operations and validation across the application.
 """
 
+import functools
 import logging
 import os
 from pathlib import Path
-from typing import Optional, Union, List, Pattern
-import re
+from typing import Dict, Optional, Union, List, Tuple
+
+# Directory listings keyed by (directory, extension), each stored with the
+# directory's mtime so any file added or removed invalidates it
+_LIST_CACHE: Dict[Tuple[str, str], Tuple[int, List[Path]]] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_user(path: str) -> str:
+    """
+    Expand the home directory in a path string, memoized for recurring paths.
+
+    Args:
+        path: Path string
+
+    Returns:
+        str: Path string with ~ expanded
+    """
+    return os.path.expanduser(path)
+
+
+def _normalize_str(path: Union[str, Path]) -> str:
+    """
+    Expand and resolve a path using string operations only.
+
+    Args:
+        path: Path string or Path object to normalize
+
+    Returns:
+        str: Normalized absolute path string
+    """
+    # Symlinks can be created or retargeted at any time, so the resolution
+    # itself is never cached
+    return os.path.realpath(_expand_user(os.fspath(path)))
 
 
 def normalize_path(path: Union[str, Path]) -> Path:
@@ -22,9 +55,7 @@ def normalize_path(path: Union[str, Path]) -> Path:
     Returns:
         Path: Normalized absolute Path object
     """
-    if isinstance(path, str):
-        path = Path(path)
-    return path.expanduser().resolve()
+    return Path(_normalize_str(path))
 
 
 def ensure_directory(directory: Union[str, Path]) -> bool:
@@ -38,19 +69,15 @@ def ensure_directory(directory: Union[str, Path]) -> bool:
         bool: True if directory exists and is writable
     """
     try:
-        dir_path = normalize_path(directory)
-        dir_path.mkdir(parents=True, exist_ok=True)
-
-        # Test write permissions with a temporary file
-        test_file = dir_path / ".write_test"
-        try:
-            test_file.write_text("test")
-            test_file.unlink()
-            
-            return True
-        except Exception as e:
-            logging.error(f"Directory is not writable: {dir_path} - {e}")
+        dir_path = _normalize_str(directory)
+        os.makedirs(dir_path, exist_ok=True)
+
+        # Permission check only; actual writes still report their own errors
+        if not os.access(dir_path, os.W_OK):
+            logging.error(f"Directory is not writable: {dir_path}")
             return False
+
+        return True
     except Exception as e:
         logging.error(f"Error creating/verifying directory: {directory} - {e}")
         return False
@@ -73,23 +100,29 @@ def validate_file_path(
         Optional[Path]: Validated Path object or None if validation fails
     """
     try:
-        path = normalize_path(file_path)
+        # Checks work on the path string; a Path is only built for the result
+        path = _normalize_str(file_path)
 
         # Validate file type if specified
-        if file_type and path.suffix.lower() != file_type.lower():
-            logging.error(f"Invalid file type: {path.suffix}. Expected: {file_type}")
-            return None
+        if file_type:
+            suffix = os.path.splitext(path)[1]
+            if suffix.lower() != file_type.lower():
+                logging.error(f"Invalid file type: {suffix}. Expected: {file_type}")
+                return None
 
         # Check existence if required
-        if must_exist and not path.exists():
+        if must_exist and not os.path.exists(path):
             logging.error(f"File not found: {path}")
             return None
 
-        # Ensure parent directory exists and is writable
-        if not ensure_directory(path.parent):
-            return None
+        # An existing file already implies its directory; otherwise create
+        # the parent only when missing and let the actual write report errors
+        if not must_exist:
+            parent = os.path.dirname(path)
+            if not os.path.isdir(parent) and not ensure_directory(parent):
+                return None
 
-        return path
+        return Path(path)
 
     except Exception as e:
         logging.error(f"Error validating file path: {file_path} - {e}")
@@ -114,8 +147,14 @@ def safe_read_file(
         if not path:
             return None
 
-        content = path.read_text(encoding=encoding)
-        if not content.strip():
+        # Empty files are rejected from their size before reading; a
+        # whitespace-only check then needs no stripped copy of the content
+        with open(path, encoding=encoding) as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                logging.error("File is empty")
+                return None
+            content = f.read()
+        if not content or content.isspace():
             logging.error("File is empty")
             return None
 
@@ -149,8 +188,9 @@ def safe_write_file(
         if not path:
             return False
 
-        mode = "a" if append else "w"
-        path.write_text(content, encoding=encoding)
+        # Encode once and write in a single call; write errors surface here
+        with open(path, "ab" if append else "wb") as f:
+            f.write(content.encode(encoding))
         logging.debug(f"Successfully wrote to file: {path}")
         return True
 
@@ -159,9 +199,15 @@ def safe_write_file(
         return False
 
 
+def clear_list_cache() -> None:
+    """Drop cached directory listings after creating or deleting files."""
+    _LIST_CACHE.clear()
+
+
 def safe_list_files(directory: Union[str, Path], extension: str = ".json") -> List[Path]:
     """
     Safely list files in a directory with specific extension.
+    Listings are reused until the directory's modification time changes.
 
     Args:
         directory: Directory to list files from
@@ -176,11 +222,25 @@ def safe_list_files(directory: Union[str, Path], extension: str = ".json") -> Li
             logging.warning(f"Directory does not exist or is not a directory: {directory}")
             return []
 
-        # Get all files with specified extension
-        files = list(dir_path.glob(f"*{extension}"))
-        
+        cache_key = (str(dir_path), extension)
+        mtime_ns = dir_path.stat().st_mtime_ns
+        cached = _LIST_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+
+        # One directory read; names are filtered and sorted as plain strings
+        with os.scandir(dir_path) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(extension) and entry.is_file()
+            ]
+        names.sort()
+        files = [dir_path / name for name in names]
+        _LIST_CACHE[cache_key] = (mtime_ns, files)
+
         logging.debug(f"Found {len(files)} {extension} files in {dir_path}")
-        return sorted(files)
+        return list(files)
 
     except Exception as e:
         logging.error(f"Error listing directory contents: {directory} - {e}")
@@ -4,17 +4,125 @@ Utility functions for handling transcription operations.
 Provides reusable functions for saving and processing transcriptions.
 """
 
+import functools
 import logging
-from typing import Optional, Tuple, Callable, Dict, Any
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple, Callable, Dict, Any
 from threading import Event
 
-from speech_to_text.audio.recorder import AudioRecorder
-from speech_to_text.transcriber.whisper import WhisperTranscriber
-from speech_to_text.chat import ChatHandler
-from speech_to_text.llm import MLXWToLLM
-from speech_to_text.kokoro import KokoroHandler
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
+# Only needed for annotations; the LLM and Kokoro handlers are imported
+# in the branches that use them so other modes skip loading them
+if TYPE_CHECKING:
+    from speech_to_text.audio.recorder import AudioRecorder
+    from speech_to_text.transcriber.whisper import WhisperTranscriber
+    from speech_to_text.chat import ChatHandler
+
+from speech_to_text.utils.api_utils import TERMINAL_STATUSES
 from speech_to_text.utils.path_utils import safe_write_file, validate_file_path
 
+# Minimum spacing of silence progress updates passed to a status callback
+_PROGRESS_MIN_INTERVAL = 0.05
+
+
+class _StatusDebouncer:
+    """Status callback wrapper that drops repeated and too-frequent updates."""
+
+    def __init__(self, callback: Callable[[str, str, Optional[int]], None]):
+        """
+        Initialize the wrapper.
+
+        Args:
+            callback: Status callback to forward updates to
+        """
+        self._callback = callback
+        self._last: Optional[Tuple[str, str, Optional[int]]] = None
+        self._last_time = 0.0
+
+    def __call__(self, status: str, message: str, progress: Optional[int] = None) -> None:
+        """
+        Forward a status update unless it repeats or crowds the previous one.
+
+        Args:
+            status: Status identifier
+            message: Status message
+            progress: Optional progress value
+        """
+        update = (status, message, progress)
+        now = time.monotonic()
+        # Terminal statuses are always delivered, even when repeated
+        if status not in TERMINAL_STATUSES and self._last is not None:
+            if update == self._last:
+                return
+            # Intermediate progress of the same status is rate limited; a
+            # reset to 0 or reaching 100 always goes through
+            if (
+                progress is not None
+                and status == self._last[0]
+                and 0 < progress < 100
+                and now - self._last_time < _PROGRESS_MIN_INTERVAL
+            ):
+                return
+
+        self._last = update
+        self._last_time = now
+        self._callback(status, message, progress)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tts_pool() -> ThreadPoolExecutor:
+    """
+    Get the thread used to convert transcriptions to speech, starting it on first use.
+
+    Returns:
+        ThreadPoolExecutor: Shared text-to-speech conversion pool
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-convert")
+
+
+def _convert_to_speech(text: str, optimize: bool) -> Optional[Path]:
+    """
+    Convert text to a speech file with the shared Kokoro handler.
+
+    Args:
+        text: Text to convert
+        optimize: Whether to apply voice optimization to the text
+
+    Returns:
+        Optional[Path]: Path to the saved audio file, None if conversion failed
+    """
+    from speech_to_text.kokoro import get_kokoro_handler
+
+    return get_kokoro_handler().convert_text_to_speech(text, optimize=optimize)
+
+
+# Content hash and mtime of the last overwrite per output file, so an
+# unchanged file is not rewritten with the same text
+_last_written: Dict[str, Tuple[int, int]] = {}
+
+
+def _file_mtime_ns(file_path: str) -> int:
+    """
+    Get a file's modification time.
+
+    Args:
+        file_path: File path to check
+
+    Returns:
+        int: Modification time in nanoseconds, or -1 if the file is missing
+    """
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return -1
+
 
 def save_transcription(text: str, output_file: Optional[str]) -> None:
     """
@@ -27,20 +135,27 @@ def save_transcription(text: str, output_file: Optional[str]) -> None:
     if not text or not output_file:
         return
 
+    content_hash = hash(text)
+    # Skip rewriting identical text unless the file changed since
+    if _last_written.get(output_file) == (content_hash, _file_mtime_ns(output_file)):
+        logging.debug(f"Output unchanged, skipping write: {output_file}")
+        return
+
     if safe_write_file(text, output_file):
+        _last_written[output_file] = (content_hash, _file_mtime_ns(output_file))
         logging.info(f"Transcription saved to: {output_file}")
     else:
         logging.error(f"Failed to save transcription to: {output_file}")
 
 
 def handle_transcription(
-    recorder: AudioRecorder,
-    transcriber: WhisperTranscriber,
+    recorder: "AudioRecorder",
+    transcriber: "WhisperTranscriber",
     copy_to_clipboard: bool = False,
     output_file: Optional[str] = None,
     use_kokoro: bool = False,
     use_llm: bool = False,
-    chat_handler: Optional[ChatHandler] = None,
+    chat_handler: Optional["ChatHandler"] = None,
     stream_to_speakers: bool = False,
     save_to_file: bool = True,
     optimize_voice: bool = False,
@@ -69,6 +184,9 @@ def handle_transcription(
     Returns:
         Tuple[bool, Optional[str], Optional[Dict]]: (continue_flag, error_message, response_data)
     """
+    # Shared by the recorder and this cycle's own updates
+    if status_callback:
+        status_callback = _StatusDebouncer(status_callback)
 
     def update_status(status: str, message: str, progress: Optional[int] = None):
         """Helper to call status callback if provided."""
@@ -84,6 +202,10 @@ def handle_transcription(
             return True, error_msg, None
         logging.info(f"Using document context from: {doc_path}")
 
+        # Process the document while the user is speaking
+        if chat_handler:
+            chat_handler.prefetch_document(doc_path)
+
     # Set status callback for recorder
     recorder.set_status_callback(status_callback)
 
@@ -170,7 +292,8 @@ def handle_transcription(
     # Handle clipboard copy
     if copy_to_clipboard:
         try:
-            import pyperclip
+            if pyperclip is None:
+                raise RuntimeError("pyperclip is not installed")
             pyperclip.copy(text)
             logging.info("Text copied to clipboard")
             update_status("complete", "Ready to paste from clipboard", None)
@@ -180,42 +303,57 @@ def handle_transcription(
             update_status("error", error_msg, None)
             return True, error_msg, response_data
 
-    # Handle file output
+    # Handle file output; an LLM response replaces the transcription in
+    # the file, so with LLM processing the transcription is only written
+    # if no response is
     files_saved = []
-    if output_file:
-        save_transcription(text, output_file)
-        files_saved.append(output_file)
+
+    def save_output(content: str) -> None:
+        """Helper to save output once per cycle if an output file is set."""
+        if output_file:
+            save_transcription(content, output_file)
+            if output_file not in files_saved:
+                files_saved.append(output_file)
+
+    is_exit = transcriber.check_exit_command(result)
+    if not use_llm or is_exit:
+        save_output(text)
 
     # Check for exit command
-    if transcriber.check_exit_command(result):
+    if is_exit:
         logging.info("Exit command received")
         return False, None, response_data
 
+    # Convert the transcription to speech while the LLM processes it
+    tts_future: Optional[Future] = None
+    if use_kokoro and not stream_to_speakers:  # Skip if already streaming
+        tts_future = _get_tts_pool().submit(_convert_to_speech, text, optimize_voice)
+
     # Handle LLM processing
+    llm_error: Optional[str] = None
     if use_llm:
         try:
-            llm_handler = MLXWToLLM()
+            from speech_to_text.llm import get_llm_handler
+
+            llm_handler = get_llm_handler()
             llm_response = llm_handler.process_text(text)
             if llm_response:
                 logging.info("LLM processing completed successfully")
                 response_data["llm_response"] = llm_response
-                if output_file:
-                    save_transcription(llm_response, output_file)
-                    files_saved.append(output_file)
+                save_output(llm_response)
                 update_status("complete", llm_response, None)
+            else:
+                save_output(text)
         except Exception as e:
-            error_msg = f"Error in LLM processing: {e}"
-            logging.error(error_msg)
-            update_status("error", error_msg, None)
-            return True, error_msg, response_data
+            # Reported once the speech conversion already under way finishes
+            llm_error = f"Error in LLM processing: {e}"
+            logging.error(llm_error)
+            save_output(text)
 
     # Handle Kokoro conversion
-    if use_kokoro and not stream_to_speakers:  # Skip if already streaming
+    if tts_future is not None:
         try:
-            kokoro_handler = KokoroHandler()
-            output_path = kokoro_handler.convert_text_to_speech(
-                text, optimize=optimize_voice
-            )
+            output_path = tts_future.result()
             if output_path:
                 logging.info(f"Text-to-speech conversion saved to: {output_path}")
                 response_data["audio_path"] = str(output_path)
@@ -223,8 +361,13 @@ def handle_transcription(
         except Exception as e:
             error_msg = f"Error in Kokoro conversion: {e}"
             logging.error(error_msg)
-            update_status("error", error_msg, None)
-            return True, error_msg, response_data
+            if llm_error is None:
+                update_status("error", error_msg, None)
+                return True, error_msg, response_data
+
+    if llm_error is not None:
+        update_status("error", llm_error, None)
+        return True, llm_error, response_data
 
     # Final status update for file saves
     if files_saved and not chat_handler and not copy_to_clipboard: